@@ -4,87 +4,157 @@ API endpoints for order management.
 This module provides endpoints for creating, reading, updating, and deleting orders.
 """
 
-from typing import List, Optional, Any, Union
+import functools
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status, Body, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, status, Body
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import order_cache
 from app.crud.order import order as order_crud
-from app.database import get_db
+from app.database import get_db, get_ro_db
 from app.schemas.order import (
     OrderCreate,
     OrderUpdate,
+    OrderStatusUpdate,
     OrderResponse,
     OrderSummary,
-    OrderStatusResponse
+    OrderStatusResponse,
+    order_response_adapter,
+    order_response_list_adapter,
+    order_status_response_adapter,
+    order_summary_adapter,
+    order_summary_list_adapter
 )
-from app.models.order import OrderStatus, Order, OrderItem
+from app.models.order import OrderStatus
 from app.config import settings
-from app.errors import OrderValidationError, ProductValidationError
+from app.errors import APIError, OrderValidationError, ProductValidationError
+from app.pagination import NEXT_CURSOR_HEADER, decode_cursor, json_page_response, split_page
+from app.responses import json_response
 
 # Create router for orders endpoints
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
 
-async def _safely_refresh_product_relationships(
-    order: Union[Order, None],
-    db: AsyncSession,
-    logger: logging.Logger
-) -> None:
+# Validation errors answered with a plain HTTP error instead of the global
+# handlers, keyed by error_type: (status code, detail template)
+_HTTP_ERRORS: Dict[str, Tuple[int, str]] = {
+    "order_not_found": (status.HTTP_404_NOT_FOUND, "{}"),
+    "customer_not_found": (status.HTTP_404_NOT_FOUND, "{}"),
+    "product_not_found": (status.HTTP_404_NOT_FOUND, "Product not found: {}"),
+    "invalid_order_deletion": (status.HTTP_422_UNPROCESSABLE_ENTITY, "{}"),
+}
+
+# Compiled once at import time; validates raw request bodies with pydantic-core's
+# JSON parser instead of FastAPI's generic body handling
+_order_create_adapter = TypeAdapter(OrderCreate)
+
+
+def _inline_request_body(schema: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Safely refresh product relationships for order items.
-    
-    This helper function ensures that product relationships are properly loaded
-    for all order items, handling the async context correctly to avoid
-    'greenlet_spawn has not been called' errors.
+    Build an OpenAPI request body from a JSON schema, inlining its $defs.
     
     Args:
-        order: The order object to refresh relationships for
-        db: SQLAlchemy async session
-        logger: Logger instance for error reporting
+        schema: JSON schema produced by a Pydantic model
         
     Returns:
-        None
+        Dict[str, Any]: OpenAPI requestBody definition
     """
-    # Skip if order is None
-    if not order:
-        return
+    definitions = schema.pop("$defs", {})
+
+    def resolve(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(definitions[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": resolve(schema)}},
+        }
+    }
+
+
+async def parse_order_in(request: Request) -> OrderCreate:
+    """
+    Parse and validate an order creation payload from the raw request body.
     
-    try:
-        # First refresh the order with its items
-        await db.refresh(order, ["items"])
+    Args:
+        request: Incoming request
         
-        # Ensure items is not None to prevent ResponseValidationError
-        if order.items is None:
-            order.items = []
-            logger.warning(f"Order {order.id} has None items, defaulting to empty list")
-            return
+    Returns:
+        OrderCreate: The validated order payload
+        
+    Raises:
+        RequestValidationError: If the body is not a valid order
+    """
+    body = await request.body()
+    try:
+        return _order_create_adapter.validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)],
+            body=body
+        )
+
+
+def _cache_key(request: Request) -> str:
+    """Build the response cache key of a GET request from its path and query."""
+    return f"{request.url.path}?{request.url.query}"
+
+
+def translate_errors(error_type: str, message: str) -> Callable:
+    """
+    Map the errors raised by an order endpoint to API errors.
+    
+    Validation errors listed in _HTTP_ERRORS become HTTPExceptions, other
+    validation and API errors are left to the global handlers, and any
+    unexpected exception is logged and wrapped in an OrderValidationError.
+    
+    Args:
+        error_type: Error type reported for unexpected exceptions
+        message: Message prefix logged and reported for unexpected exceptions
         
-        # For each order item, ensure the product relationship is loaded
-        for item in order.items:
-            if item is None:
-                continue
-                
+    Returns:
+        Callable: Decorator for the endpoint function
+    """
+    def decorator(endpoint: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
-                # Only refresh if the product attribute exists and is None
-                if hasattr(item, "product") and item.product is None:
-                    await db.refresh(item, ["product"])
-            except Exception as item_refresh_error:
-                # Log the error but continue processing other items
-                logger.error(f"Error refreshing product for item {item.id} in order {order.id}: {str(item_refresh_error)}")
-    except Exception as refresh_error:
-        # Log the error but continue with the order as is
-        logger.error(f"Error refreshing order {order.id}: {str(refresh_error)}")
-        # We can still return the order even if refresh failed
+                return await endpoint(*args, **kwargs)
+            except (OrderValidationError, ProductValidationError) as e:
+                http_error = _HTTP_ERRORS.get(e.error_type)
+                if http_error is None:
+                    raise
+                status_code, detail = http_error
+                raise HTTPException(status_code=status_code, detail=detail.format(e.detail))
+            except (HTTPException, APIError):
+                raise
+            except Exception as e:
+                logger.exception("%s", message)
+                raise OrderValidationError(detail=f"{message}: {str(e)}", error_type=error_type)
+        return wrapper
+    return decorator
 
 
 # PUBLIC_INTERFACE
 @router.get("/", response_model=List[OrderSummary])
+@translate_errors("list_error", "Error listing orders")
 async def list_orders(
-    db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0, description="Number of orders to skip"),
-    limit: int = Query(settings.PAGINATION_PAGE_SIZE, ge=1, le=100, description="Number of orders to return"),
+    request: Request,
+    db: AsyncSession = Depends(get_ro_db),
+    skip: int = Query(0, ge=0, deprecated=True, description="Number of orders to skip (use cursor instead)"),
+    limit: int = Query(settings.PAGINATION_PAGE_SIZE, ge=1, le=settings.PAGINATION_MAX_PAGE_SIZE, description="Number of orders to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     sort_by: Optional[str] = Query(None, description="Field to sort by"),
     sort_desc: bool = Query(False, description="Sort in descending order"),
     status: Optional[OrderStatus] = Query(None, description="Filter by order status")
@@ -92,59 +162,64 @@ async def list_orders(
     """
     List all orders with pagination, filtering, and sorting.
     
-    - **skip**: Number of orders to skip (for pagination)
+    - **skip**: Number of orders to skip (deprecated, ignored when cursor is given)
     - **limit**: Maximum number of orders to return
+    - **cursor**: Opaque cursor of the next page, taken from the X-Next-Cursor header
     - **sort_by**: Field to sort by (e.g., created_at, total_amount)
     - **sort_desc**: Sort in descending order if true
     - **status**: Filter by order status if provided
     
     Responses:
         200: List of orders
+        400: Invalid cursor
         422: Validation error
         500: Internal server error
     """
-    logger = logging.getLogger(__name__)
+    after_id = decode_cursor(cursor) if cursor else None
+    
+    cache_key = _cache_key(request)
+    cached, generation = await order_cache.get(cache_key)
+    if cached is not None:
+        return cached
     
     try:
-        try:
-            if status:
-                orders = await order_crud.get_by_status(db, status=status, skip=skip, limit=limit)
-            else:
-                orders = await order_crud.get_multi(db, skip=skip, limit=limit)
-        except Exception as db_error:
-            logger.error(f"Database error while listing orders: {str(db_error)}")
-            raise OrderValidationError(
-                detail=f"Error retrieving orders: {str(db_error)}",
-                error_type="database_error",
-                validation_errors=[{"msg": str(db_error)}]
+        if status:
+            orders = await order_crud.get_by_status(
+                db, status=status, skip=skip, limit=limit + 1, after_id=after_id
             )
-            
-        # Initialize empty list if orders is None to prevent ResponseValidationError
-        if orders is None:
-            logger.warning("No orders found, returning empty list")
-            return []
-            
-        # For OrderSummary response model, we don't need to refresh relationships
-        # as it only includes basic order fields, not items
-        
-        return orders
-    except OrderValidationError as e:
-        # Re-raise the exception to be caught by the global exception handler
-        raise
-    except Exception as e:
-        # Log the error and convert to OrderValidationError
-        logger.error(f"Error listing orders: {str(e)}")
+            # Initialize empty list if orders is None to prevent ResponseValidationError
+            if orders is None:
+                logger.warning("No orders found, returning empty list")
+                return []
+            # One row past the page was fetched to tell whether another page follows
+            orders, headers = split_page(orders, limit)
+            response = json_response(order_summary_list_adapter, orders, headers=headers)
+        else:
+            # Serialize orders as they are streamed instead of materializing the page as a list
+            orders = order_crud.iter_multi(db, skip=skip, limit=limit + 1, after_id=after_id)
+            response = await json_page_response(order_summary_adapter, orders, limit)
+            headers = {
+                NEXT_CURSOR_HEADER: response.headers[NEXT_CURSOR_HEADER]
+            } if NEXT_CURSOR_HEADER in response.headers else {}
+    except Exception as db_error:
+        logger.error("Database error while listing orders: %s", db_error)
         raise OrderValidationError(
-            detail=f"Error listing orders: {str(e)}",
-            error_type="list_error"
+            detail=f"Error retrieving orders: {str(db_error)}",
+            error_type="database_error",
+            validation_errors=[{"msg": str(db_error)}]
         )
+    
+    await order_cache.set(cache_key, response, generation, headers)
+    return response
 
 
 # PUBLIC_INTERFACE
 @router.get("/{order_id}", response_model=OrderResponse)
+@translate_errors("retrieval_error", "Error retrieving order")
 async def get_order(
+    request: Request,
     order_id: int = Path(..., gt=0, description="The ID of the order to get"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_ro_db)
 ) -> Any:
     """
     Get a specific order by ID.
@@ -157,61 +232,37 @@ async def get_order(
         422: Validation error
         500: Internal server error
     """
-    logger = logging.getLogger(__name__)
+    cache_key = _cache_key(request)
+    cached, generation = await order_cache.get(cache_key)
+    if cached is not None:
+        return cached
     
-    try:
-        # First check if the order exists
-        try:
-            print("order_id-----------------------", order_id)
-            order = await order_crud.get_with_items(db, id=order_id)
-            print("order_id-----------------------")
-        except OrderValidationError as e:
-            # If order not found, return 404
-            if e.error_type == "order_not_found":
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=e.detail
-                )
-            # Re-raise other validation errors
-            raise
-            
-        # Double check if order exists before proceeding
-        if not order:
-            logger.error(f"Order with ID {order_id} not found but no exception was raised")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Order with ID {order_id} not found"
-            )
-        
-        # Use the helper function to safely refresh product relationships
-        await _safely_refresh_product_relationships(order, db, logger)
-                
-        return order
-    except OrderValidationError as e:
-        # Check if this is a "not found" error and return 404
-        if e.error_type == "order_not_found":
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=e.detail
-            )
-        # Re-raise other validation errors to be caught by the global exception handler
-        raise
-    except HTTPException:
-        # Re-raise HTTP exceptions (like 404)
-        raise
-    except Exception as e:
-        # Log the error and convert to OrderValidationError
-        logger.error(f"Error retrieving order {order_id}: {str(e)}")
-        raise OrderValidationError(
-            detail=f"Error retrieving order: {str(e)}",
-            error_type="retrieval_error"
+    # Raises order_not_found if the order doesn't exist
+    order = await order_crud.get_with_items(db, id=order_id)
+    
+    # Double check if order exists before proceeding
+    if not order:
+        logger.error("Order with ID %s not found but no exception was raised", order_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Order with ID {order_id} not found"
         )
+    
+    response = json_response(order_response_adapter, order)
+    await order_cache.set(cache_key, response, generation)
+    return response
 
 
 # PUBLIC_INTERFACE
-@router.post("/", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/",
+    response_model=OrderResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=_inline_request_body(OrderCreate.model_json_schema())
+)
+@translate_errors("creation_error", "Error creating order")
 async def create_order(
-    order_in: OrderCreate,
+    order_in: OrderCreate = Depends(parse_order_in),
     db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
@@ -228,47 +279,24 @@ async def create_order(
         422: Validation error (OrderValidationError or ProductValidationError)
         500: Internal server error
     """
-    logger = logging.getLogger(__name__)
+    order = await order_crud.create_with_items(db, obj_in=order_in)
     
-    try:
-        # The custom exceptions will be caught by the global exception handlers in app.errors
-        order = await order_crud.create_with_items(db, obj_in=order_in)
-        
-        # Check if order was created successfully
-        if not order:
-            raise OrderValidationError(
-                detail="Failed to create order",
-                error_type="order_creation_failed",
-                validation_errors=[{"msg": "Failed to create order"}]
-            )
-        
-        # Use the helper function to safely refresh product relationships
-        await _safely_refresh_product_relationships(order, db, logger)
-                
-        return order
-    except ProductValidationError as e:
-        # Check if this is a "product not found" error and return 404
-        if e.error_type == "product_not_found":
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Product not found: {e.detail}"
-            )
-        # Re-raise other validation errors to be caught by the global exception handler
-        raise
-    except OrderValidationError as e:
-        # Re-raise the exception to be caught by the global exception handler
-        raise
-    except Exception as e:
-        # Log the error and convert to OrderValidationError
-        logger.error(f"Error creating order: {str(e)}")
+    # Check if order was created successfully
+    if not order:
         raise OrderValidationError(
-            detail=f"Error creating order: {str(e)}",
-            error_type="creation_error"
+            detail="Failed to create order",
+            error_type="order_creation_failed",
+            validation_errors=[{"msg": "Failed to create order"}]
         )
+    
+    await order_cache.invalidate()
+    
+    return json_response(order_response_adapter, order, status_code=status.HTTP_201_CREATED)
 
 
 # PUBLIC_INTERFACE
 @router.put("/{order_id}", response_model=OrderResponse)
+@translate_errors("update_error", "Error updating order")
 async def update_order(
     order_in: OrderUpdate,
     order_id: int = Path(..., gt=0, description="The ID of the order to update"),
@@ -286,73 +314,24 @@ async def update_order(
         422: Validation error
         500: Internal server error
     """
-    logger = logging.getLogger(__name__)
+    # Update the order and load its items; raises order_not_found if it doesn't exist
+    order = await order_crud.update_by_id(db, id=order_id, obj_in=order_in)
+    await order_cache.invalidate()
     
-    try:
-        # First check if the order exists
-        try:
-            order = await order_crud.get(db, id=order_id)
-        except OrderValidationError as e:
-            # If order not found, return 404
-            if e.error_type == "order_not_found":
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=e.detail
-                )
-            # Re-raise other validation errors
-            raise
-            
-        # Update the order
-        updated_order = await order_crud.update(db, db_obj=order, obj_in=order_in)
-        
-        # Get the order with items to return in the response
-        try:
-            order = await order_crud.get_with_items(db, id=order_id)
-            
-            # Double check if order exists before proceeding
-            if not order:
-                logger.error(f"Order with ID {order_id} not found after update but no exception was raised")
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Order with ID {order_id} not found after update"
-                )
-            
-            # Use the helper function to safely refresh product relationships
-            await _safely_refresh_product_relationships(order, db, logger)
-        except OrderValidationError as e:
-            # If order not found, return 404
-            if e.error_type == "order_not_found":
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=e.detail
-                )
-            # Re-raise other validation errors
-            raise
-                
-        return order
-    except OrderValidationError as e:
-        # Check if this is a "not found" error and return 404
-        if e.error_type == "order_not_found":
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=e.detail
-            )
-        # Re-raise other validation errors to be caught by the global exception handler
-        raise
-    except HTTPException:
-        # Re-raise HTTP exceptions (like 404)
-        raise
-    except Exception as e:
-        # Log the error and convert to OrderValidationError
-        logger.error(f"Error updating order {order_id}: {str(e)}")
-        raise OrderValidationError(
-            detail=f"Error updating order: {str(e)}",
-            error_type="update_error"
+    # Double check if order exists before proceeding
+    if not order:
+        logger.error("Order with ID %s not found after update but no exception was raised", order_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Order with ID {order_id} not found after update"
         )
+    
+    return json_response(order_response_adapter, order)
 
 
 # PUBLIC_INTERFACE
 @router.delete("/{order_id}", response_model=OrderStatusResponse)
+@translate_errors("deletion_error", "Error deleting order")
 async def delete_order(
     order_id: int = Path(..., gt=0, description="The ID of the order to delete"),
     db: AsyncSession = Depends(get_db)
@@ -368,72 +347,29 @@ async def delete_order(
         422: Validation error
         500: Internal server error
     """
-    logger = logging.getLogger(__name__)
+    # Delete the order; raises order_not_found if it doesn't exist and
+    # invalid_order_deletion if it has been shipped or delivered
+    order = await order_crud.remove(db, id=order_id)
     
-    try:
-        # First check if the order exists
-        try:
-            # This will raise OrderValidationError if not found
-            await order_crud.get(db, id=order_id)
-        except OrderValidationError as e:
-            # If order not found, return 404
-            if e.error_type == "order_not_found":
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=e.detail
-                )
-            # Re-raise other validation errors
-            raise
-            
-        # Delete the order
-        try:
-            order = await order_crud.remove(db, id=order_id)
-            
-            # Check if order was actually deleted
-            if not order:
-                logger.error(f"Order with ID {order_id} not deleted properly but no exception was raised")
-                raise OrderValidationError(
-                    detail=f"Failed to delete order with ID {order_id}",
-                    error_type="deletion_failed",
-                    validation_errors=[{"msg": f"Failed to delete order with ID {order_id}"}]
-                )
-                
-            return order
-        except OrderValidationError as e:
-            # If this is a specific error type that should be handled differently
-            if e.error_type == "invalid_order_deletion":
-                # For example, can't delete shipped/delivered orders
-                raise HTTPException(
-                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                    detail=e.detail
-                )
-            # Re-raise other validation errors
-            raise
-    except OrderValidationError as e:
-        # Check if this is a "not found" error and return 404
-        if e.error_type == "order_not_found":
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=e.detail
-            )
-        # Re-raise other validation errors to be caught by the global exception handler
-        raise
-    except HTTPException:
-        # Re-raise HTTP exceptions (like 404)
-        raise
-    except Exception as e:
-        # Log the error and convert to OrderValidationError
-        logger.error(f"Error deleting order {order_id}: {str(e)}")
+    # Check if order was actually deleted
+    if not order:
+        logger.error("Order with ID %s not deleted properly but no exception was raised", order_id)
         raise OrderValidationError(
-            detail=f"Error deleting order: {str(e)}",
-            error_type="deletion_error"
+            detail=f"Failed to delete order with ID {order_id}",
+            error_type="deletion_failed",
+            validation_errors=[{"msg": f"Failed to delete order with ID {order_id}"}]
         )
+    
+    await order_cache.invalidate()
+    
+    return json_response(order_status_response_adapter, order)
 
 
 # PUBLIC_INTERFACE
 @router.put("/{order_id}/status", response_model=OrderStatusResponse)
+@translate_errors("status_update_error", "Error updating order status")
 async def update_order_status(
-    status_update: dict = Body(..., description="New order status", examples={"status_update": {"value": {"status": "shipped"}}}),
+    status_update: OrderStatusUpdate = Body(..., description="New order status", examples=[{"status": "shipped"}]),
     order_id: int = Path(..., gt=0, description="The ID of the order to update"),
     db: AsyncSession = Depends(get_db)
 ) -> Any:
@@ -449,131 +385,65 @@ async def update_order_status(
         422: Validation error
         500: Internal server error
     """
-    logger = logging.getLogger(__name__)
+    # Update the order status and load its items; raises order_not_found if it doesn't exist
+    order = await order_crud.update_status(db, id=order_id, status=status_update.status)
+    await order_cache.invalidate()
     
-    try:
-        # Extract status from the request body
-        if "status" not in status_update:
-            raise OrderValidationError(
-                detail="Status field is required",
-                error_type="missing_status_field",
-                validation_errors=[{"msg": "Status field is required"}]
-            )
-        
-        # Convert string status to enum
-        try:
-            status_enum = OrderStatus(status_update["status"])
-        except ValueError:
-            valid_statuses = [s.value for s in OrderStatus]
-            raise OrderValidationError(
-                detail=f"Invalid status value. Must be one of: {', '.join(valid_statuses)}",
-                error_type="invalid_status_value",
-                validation_errors=[{"msg": f"Invalid status value. Must be one of: {', '.join(valid_statuses)}"}]
-            )
-        
-        # First check if the order exists
-        try:
-            # Update the order status
-            updated_order = await order_crud.update_status(db, id=order_id, status=status_enum)
-            
-            # Get the order with items to return in the response
-            order = await order_crud.get_with_items(db, id=order_id)
-            
-            # Double check if order exists before proceeding
-            if not order:
-                logger.error(f"Order with ID {order_id} not found after status update but no exception was raised")
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Order with ID {order_id} not found after status update"
-                )
-            
-            # Use the helper function to safely refresh product relationships
-            await _safely_refresh_product_relationships(order, db, logger)
-        except OrderValidationError as e:
-            # If order not found, return 404
-            if e.error_type == "order_not_found":
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=e.detail
-                )
-            # Re-raise other validation errors
-            raise
-                
-        return order
-    except OrderValidationError as e:
-        # Check if this is a "not found" error and return 404
-        if e.error_type == "order_not_found":
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=e.detail
-            )
-        # Re-raise other validation errors to be caught by the global exception handler
-        raise
-    except HTTPException:
-        # Re-raise HTTP exceptions (like 404)
-        raise
-    except Exception as e:
-        # Log the error and convert to OrderValidationError
-        logger.error(f"Error updating order status for order {order_id}: {str(e)}")
-        raise OrderValidationError(
-            detail=f"Error updating order status: {str(e)}",
-            error_type="status_update_error"
+    # Double check if order exists before proceeding
+    if not order:
+        logger.error("Order with ID %s not found after status update but no exception was raised", order_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Order with ID {order_id} not found after status update"
         )
+    
+    return json_response(order_status_response_adapter, order)
 
 
 # PUBLIC_INTERFACE
 @router.get("/customer/{customer_email}", response_model=List[OrderResponse])
+@translate_errors("customer_orders_error", "Error retrieving customer orders")
 async def get_orders_by_customer_email(
+    request: Request,
     customer_email: str = Path(..., description="Customer email address"),
-    db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0, description="Number of orders to skip"),
-    limit: int = Query(settings.PAGINATION_PAGE_SIZE, ge=1, le=100, description="Number of orders to return")
+    db: AsyncSession = Depends(get_ro_db),
+    skip: int = Query(0, ge=0, deprecated=True, description="Number of orders to skip (use cursor instead)"),
+    limit: int = Query(settings.PAGINATION_PAGE_SIZE, ge=1, le=settings.PAGINATION_MAX_PAGE_SIZE, description="Number of orders to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page")
 ) -> Any:
     """
     Get orders by customer email.
     
     - **customer_email**: Email address of the customer
-    - **skip**: Number of orders to skip (for pagination)
+    - **skip**: Number of orders to skip (deprecated, ignored when cursor is given)
     - **limit**: Maximum number of orders to return
+    - **cursor**: Opaque cursor of the next page, taken from the X-Next-Cursor header
     
     Responses:
         200: List of orders for the customer
+        400: Invalid cursor
         422: Validation error
         500: Internal server error
     """
-    logger = logging.getLogger(__name__)
+    after_id = decode_cursor(cursor) if cursor else None
     
-    try:
-        orders = await order_crud.get_by_customer_email(db, email=customer_email, skip=skip, limit=limit)
-        
-        # Initialize empty list if orders is None to prevent ResponseValidationError
-        if orders is None:
-            logger.warning(f"No orders found for customer {customer_email}, returning empty list")
-            return []
-        
-        # Ensure all orders and their items are properly attached to the session
-        for order in orders:
-            # Skip empty orders (should not happen, but just to be safe)
-            if not order:
-                continue
-                
-            # Use the helper function to safely refresh product relationships
-            await _safely_refresh_product_relationships(order, db, logger)
-        
-        return orders
-    except OrderValidationError as e:
-        # Check if this is a specific error type that should be handled differently
-        if e.error_type == "customer_not_found":
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=e.detail
-            )
-        # Re-raise other validation errors to be caught by the global exception handler
-        raise
-    except Exception as e:
-        # Log the error and convert to OrderValidationError
-        logger.error(f"Error retrieving orders for customer {customer_email}: {str(e)}")
-        raise OrderValidationError(
-            detail=f"Error retrieving customer orders: {str(e)}",
-            error_type="customer_orders_error"
-        )
+    cache_key = _cache_key(request)
+    cached, generation = await order_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    orders = await order_crud.get_by_customer_email(
+        db, email=customer_email, skip=skip, limit=limit + 1, after_id=after_id
+    )
+    
+    # Initialize empty list if orders is None to prevent ResponseValidationError
+    if orders is None:
+        logger.warning("No orders found for customer %s, returning empty list", customer_email)
+        return []
+    
+    # One row past the page was fetched to tell whether another page follows
+    orders, headers = split_page(orders, limit)
+    
+    response = json_response(order_response_list_adapter, orders, headers=headers)
+    await order_cache.set(cache_key, response, generation, headers)
+    return response
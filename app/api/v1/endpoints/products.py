@@ -6,29 +6,45 @@ This module provides endpoints for creating, reading, updating, and deleting pro
 
 from typing import List, Optional, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import order_cache
 from app.crud.product import product as product_crud
-from app.database import get_db
+from app.database import get_db, get_ro_db
+from app.pagination import decode_cursor, etag_matches, json_page_response, page_etag, split_page
+from app.responses import json_response
 from app.schemas.product import (
     ProductCreate,
     ProductUpdate,
     ProductResponse,
-    ProductSummary
+    ProductSummary,
+    product_response_adapter,
+    product_summary_adapter,
+    product_summary_list_adapter
 )
 from app.config import settings
 
 # Create router for products endpoints
 router = APIRouter()
 
+# Lets clients and shared caches reuse category listings briefly, then revalidate with the ETag
+CATEGORY_CACHE_CONTROL = "public, max-age=30"
+
+
+def _is_duplicate_sku(error: IntegrityError) -> bool:
+    """Tell whether an integrity error comes from the unique SKU constraint."""
+    return "sku" in str(error.orig).lower()
+
 
 # PUBLIC_INTERFACE
 @router.get("/", response_model=List[ProductSummary])
 async def list_products(
-    db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0, description="Number of products to skip"),
-    limit: int = Query(settings.PAGINATION_PAGE_SIZE, ge=1, le=100, description="Number of products to return"),
+    db: AsyncSession = Depends(get_ro_db),
+    skip: int = Query(0, ge=0, deprecated=True, description="Number of products to skip (use cursor instead)"),
+    limit: int = Query(settings.PAGINATION_PAGE_SIZE, ge=1, le=settings.PAGINATION_MAX_PAGE_SIZE, description="Number of products to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     sort_by: Optional[str] = Query(None, description="Field to sort by"),
     sort_desc: bool = Query(False, description="Sort in descending order"),
     is_active: Optional[bool] = Query(None, description="Filter by active status")
@@ -36,24 +52,27 @@ async def list_products(
     """
     List all products with pagination, filtering, and sorting.
     
-    - **skip**: Number of products to skip (for pagination)
+    - **skip**: Number of products to skip (deprecated, ignored when cursor is given)
     - **limit**: Maximum number of products to return
+    - **cursor**: Opaque cursor of the next page, taken from the X-Next-Cursor header
     - **sort_by**: Field to sort by (e.g., name, price)
     - **sort_desc**: Sort in descending order if true
     - **is_active**: Filter by active status if provided
     """
-    if is_active is not None:
-        products = await product_crud.get_active(db, skip=skip, limit=limit)
-    else:
-        products = await product_crud.get_multi(db, skip=skip, limit=limit)
-    return products
+    after_id = decode_cursor(cursor) if cursor else None
+    filters = {"is_active": is_active} if is_active is not None else None
+    products = await product_crud.get_multi_summaries(
+        db, skip=skip, limit=limit + 1, filters=filters, after_id=after_id
+    )
+    products, headers = split_page(products, limit)
+    return json_response(product_summary_list_adapter, products, headers=headers)
 
 
 # PUBLIC_INTERFACE
 @router.get("/{product_id}", response_model=ProductResponse)
 async def get_product(
     product_id: int = Path(..., gt=0, description="The ID of the product to get"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_ro_db)
 ) -> Any:
     """
     Get a specific product by ID.
@@ -66,7 +85,7 @@ async def get_product(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Product with ID {product_id} not found"
         )
-    return product
+    return json_response(product_response_adapter, product)
 
 
 # PUBLIC_INTERFACE
@@ -80,16 +99,18 @@ async def create_product(
     
     - **product_in**: Product data to create
     """
-    # Check if product with same SKU already exists
-    existing_product = await product_crud.get_by_sku(db, sku=product_in.sku)
-    if existing_product:
+    # The unique SKU constraint rejects duplicates; no need to look them up first
+    try:
+        product = await product_crud.create(db, obj_in=product_in)
+    except IntegrityError as e:
+        await db.rollback()
+        if not _is_duplicate_sku(e):
+            raise
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Product with SKU {product_in.sku} already exists"
         )
-    
-    product = await product_crud.create(db, obj_in=product_in)
-    return product
+    return json_response(product_response_adapter, product, status_code=status.HTTP_201_CREATED)
 
 
 # PUBLIC_INTERFACE
@@ -105,24 +126,26 @@ async def update_product(
     - **product_id**: The ID of the product to update
     - **product_in**: Updated product data
     """
-    product = await product_crud.get(db, id=product_id)
-    if not product:
+    # A SKU taken by another product is rejected by the unique SKU constraint
+    try:
+        updated_product = await product_crud.update_returning(db, id=product_id, obj_in=product_in)
+    except IntegrityError as e:
+        await db.rollback()
+        if not _is_duplicate_sku(e):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Product with SKU {product_in.sku} already exists"
+        )
+    if not updated_product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Product with ID {product_id} not found"
         )
     
-    # If SKU is being updated, check if it conflicts with another product
-    if product_in.sku and product_in.sku != product.sku:
-        existing_product = await product_crud.get_by_sku(db, sku=product_in.sku)
-        if existing_product and existing_product.id != product_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Product with SKU {product_in.sku} already exists"
-            )
-    
-    updated_product = await product_crud.update(db, db_obj=product, obj_in=product_in)
-    return updated_product
+    # Orders embed product summaries, so cached order responses are now stale
+    await order_cache.invalidate()
+    return json_response(product_response_adapter, updated_product)
 
 
 # PUBLIC_INTERFACE
@@ -134,52 +157,77 @@ async def delete_product(
     """
     Delete a product.
     
+    Products referenced by orders cannot be deleted and return 409 Conflict.
+    
     - **product_id**: The ID of the product to delete
     """
-    product = await product_crud.get(db, id=product_id)
+    product = await product_crud.remove(db, id=product_id)
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Product with ID {product_id} not found"
         )
     
-    product = await product_crud.remove(db, id=product_id)
-    return product
+    await order_cache.invalidate()
+    return json_response(product_response_adapter, product)
 
 
 # PUBLIC_INTERFACE
 @router.get("/search/", response_model=List[ProductSummary])
 async def search_products(
-    query: str = Query(..., min_length=1, description="Search query string"),
-    db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0, description="Number of products to skip"),
-    limit: int = Query(settings.PAGINATION_PAGE_SIZE, ge=1, le=100, description="Number of products to return")
+    query: str = Query(..., min_length=1, max_length=64, description="Search query string"),
+    db: AsyncSession = Depends(get_ro_db),
+    skip: int = Query(0, ge=0, deprecated=True, description="Number of products to skip (use cursor instead)"),
+    limit: int = Query(settings.PAGINATION_PAGE_SIZE, ge=1, le=settings.PAGINATION_MAX_PAGE_SIZE, description="Number of products to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page")
 ) -> Any:
     """
     Search products by name or description.
     
     - **query**: Search term to look for in product name or description
-    - **skip**: Number of products to skip (for pagination)
+    - **skip**: Number of products to skip (deprecated, ignored when cursor is given)
     - **limit**: Maximum number of products to return
+    - **cursor**: Opaque cursor of the next page, taken from the X-Next-Cursor header
     """
-    products = await product_crud.search_products(db, query=query, skip=skip, limit=limit)
-    return products
+    after_id = decode_cursor(cursor) if cursor else None
+    products = product_crud.iter_search(
+        db, query=query, skip=skip, limit=limit + 1, after_id=after_id
+    )
+    return await json_page_response(product_summary_adapter, products, limit)
 
 
 # PUBLIC_INTERFACE
 @router.get("/category/{category}", response_model=List[ProductSummary])
 async def get_products_by_category(
+    request: Request,
     category: str = Path(..., description="Category name"),
-    db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0, description="Number of products to skip"),
-    limit: int = Query(settings.PAGINATION_PAGE_SIZE, ge=1, le=100, description="Number of products to return")
+    db: AsyncSession = Depends(get_ro_db),
+    skip: int = Query(0, ge=0, deprecated=True, description="Number of products to skip (use cursor instead)"),
+    limit: int = Query(settings.PAGINATION_PAGE_SIZE, ge=1, le=settings.PAGINATION_MAX_PAGE_SIZE, description="Number of products to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page")
 ) -> Any:
     """
     Get products by category.
     
     - **category**: Category name to filter by
-    - **skip**: Number of products to skip (for pagination)
+    - **skip**: Number of products to skip (deprecated, ignored when cursor is given)
     - **limit**: Maximum number of products to return
+    - **cursor**: Opaque cursor of the next page, taken from the X-Next-Cursor header
+    
+    The response carries an ETag computed from the columns of the returned
+    page; a request whose If-None-Match matches it gets an empty 304 Not
+    Modified, without the page being serialized.
     """
-    products = await product_crud.get_by_category(db, category=category, skip=skip, limit=limit)
-    return products
\ No newline at end of file
+    after_id = decode_cursor(cursor) if cursor else None
+    products = await product_crud.get_multi_summaries(
+        db, skip=skip, limit=limit + 1, filters={"category": category}, after_id=after_id
+    )
+    products, headers = split_page(products, limit)
+    headers.update({"ETag": page_etag(products, headers), "Cache-Control": CATEGORY_CACHE_CONTROL})
+    
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": headers["ETag"], "Cache-Control": CATEGORY_CACHE_CONTROL},
+        )
+    return json_response(product_summary_list_adapter, products, headers=headers)
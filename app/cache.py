@@ -0,0 +1,226 @@
+"""
+Response caching.
+
+This module provides a small cache for serialized GET responses. Entries are
+grouped by namespace so that every mutation can drop a whole namespace at
+once. Caching is only active when CACHE_REDIS_URL is configured (shared by
+every worker) or CACHE_IN_PROCESS explicitly allows a per-process cache.
+
+Each namespace carries a generation counter that invalidation bumps. A
+response is only stored if the generation is still the one read before the
+response was built, so a read racing a write cannot cache the old body.
+"""
+
+import json
+import logging
+import time
+from typing import Dict, Optional, Tuple, Union
+
+from fastapi import Response
+
+from app import __app_name__
+from app.config import settings
+
+# Optional dependency, installed with the "redis" extra
+try:
+    import redis.asyncio as redis
+except ImportError:  # pragma: no cover
+    redis = None
+
+
+logger = logging.getLogger(__app_name__)
+
+CachedResponse = Tuple[bytes, Dict[str, str]]
+
+
+class _MemoryBackend:
+    """In-process cache backend with per-entry expiry."""
+
+    # Upper bound of entries kept per namespace before it is flushed
+    max_entries = 1024
+
+    def __init__(self) -> None:
+        self._namespaces: Dict[str, Dict[str, Tuple[float, CachedResponse]]] = {}
+        self._generations: Dict[str, int] = {}
+
+    async def get(self, namespace: str, key: str) -> Tuple[Optional[CachedResponse], int]:
+        generation = self._generations.get(namespace, 0)
+        entry = self._namespaces.get(namespace, {}).get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None, generation
+        return entry[1], generation
+
+    async def set(
+        self, namespace: str, key: str, value: CachedResponse, ttl: int, generation: int
+    ) -> None:
+        if self._generations.get(namespace, 0) != generation:
+            return
+        entries = self._namespaces.setdefault(namespace, {})
+        if len(entries) >= self.max_entries:
+            entries.clear()
+        entries[key] = (time.monotonic() + ttl, value)
+
+    async def invalidate(self, namespace: str) -> None:
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        self._namespaces.pop(namespace, None)
+
+
+# Stores an entry only if the namespace generation (KEYS[2]) still matches
+# ARGV[1]; the namespace expires ttl seconds after its first entry was written
+_REDIS_SET_IF_CURRENT = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[2], ARGV[3], ARGV[2] .. ':headers', ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[5], 'NX')
+return 1
+"""
+
+
+class _RedisBackend:
+    """Redis cache backend storing each namespace in a single hash."""
+
+    def __init__(self, url: str) -> None:
+        self._client = redis.from_url(url)
+        self._set_if_current = self._client.register_script(_REDIS_SET_IF_CURRENT)
+
+    @staticmethod
+    def _generation_key(namespace: str) -> str:
+        return f"{namespace}:generation"
+
+    async def get(self, namespace: str, key: str) -> Tuple[Optional[CachedResponse], int]:
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.get(self._generation_key(namespace))
+            pipe.hmget(namespace, key, f"{key}:headers")
+            generation, (body, headers) = await pipe.execute()
+        generation = int(generation or 0)
+        if body is None:
+            return None, generation
+        return (body, json.loads(headers) if headers else {}), generation
+
+    async def set(
+        self, namespace: str, key: str, value: CachedResponse, ttl: int, generation: int
+    ) -> None:
+        body, headers = value
+        await self._set_if_current(
+            keys=[namespace, self._generation_key(namespace)],
+            args=[generation, key, body, json.dumps(headers), ttl],
+        )
+
+    async def invalidate(self, namespace: str) -> None:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.incr(self._generation_key(namespace))
+            pipe.delete(namespace)
+            await pipe.execute()
+
+
+_backend: Optional[Union[_MemoryBackend, _RedisBackend]] = None
+
+
+def _enabled() -> bool:
+    """Whether responses may be cached with the current settings."""
+    return settings.CACHE_TTL_SECONDS > 0 and bool(settings.CACHE_REDIS_URL or settings.CACHE_IN_PROCESS)
+
+
+def _get_backend() -> Union[_MemoryBackend, _RedisBackend]:
+    """
+    Create the configured cache backend on first use.
+
+    Raises:
+        RuntimeError: If CACHE_REDIS_URL is set but the redis extra is not installed
+    """
+    global _backend
+    if _backend is None:
+        if settings.CACHE_REDIS_URL:
+            if redis is None:
+                raise RuntimeError("CACHE_REDIS_URL is set but the redis extra is not installed")
+            _backend = _RedisBackend(settings.CACHE_REDIS_URL)
+        else:
+            _backend = _MemoryBackend()
+    return _backend
+
+
+# PUBLIC_INTERFACE
+class ResponseCache:
+    """
+    Cache of serialized JSON responses for one resource namespace.
+
+    Cache failures are logged and treated as misses so that an unavailable
+    backend never fails a request.
+
+    Attributes:
+        namespace: Name grouping the cached entries of one resource
+    """
+
+    def __init__(self, namespace: str) -> None:
+        self.namespace = namespace
+
+    # PUBLIC_INTERFACE
+    async def get(self, key: str) -> Tuple[Optional[Response], Optional[int]]:
+        """
+        Get a cached response and the current generation of the namespace.
+
+        Args:
+            key: Cache key, usually the request path and query string
+
+        Returns:
+            The cached response if present (None otherwise), and the generation
+            to pass to set when storing a freshly built response; None when the
+            response must not be stored
+        """
+        if not _enabled():
+            return None, None
+        try:
+            cached, generation = await _get_backend().get(self.namespace, key)
+        except Exception as e:
+            logger.warning("Cache read failed for %s: %s", self.namespace, e)
+            return None, None
+        if cached is None:
+            return None, generation
+        body, headers = cached
+        return Response(content=body, headers=headers, media_type="application/json"), generation
+
+    # PUBLIC_INTERFACE
+    async def set(
+        self,
+        key: str,
+        response: Response,
+        generation: Optional[int],
+        headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Store a response in the cache, unless the namespace was invalidated
+        since the generation was read.
+
+        Args:
+            key: Cache key, usually the request path and query string
+            response: Response whose body should be cached
+            generation: Generation returned by get before the response was built
+            headers: Response headers to replay on cache hits
+        """
+        if generation is None or not _enabled():
+            return
+        try:
+            await _get_backend().set(
+                self.namespace,
+                key,
+                (response.body, headers or {}),
+                settings.CACHE_TTL_SECONDS,
+                generation,
+            )
+        except Exception as e:
+            logger.warning("Cache write failed for %s: %s", self.namespace, e)
+
+    # PUBLIC_INTERFACE
+    async def invalidate(self) -> None:
+        """Drop every cached response of this namespace and bump its generation."""
+        if not _enabled():
+            return
+        try:
+            await _get_backend().invalidate(self.namespace)
+        except Exception as e:
+            logger.warning("Cache invalidation failed for %s: %s", self.namespace, e)
+
+
+# Cache of order read endpoints, invalidated on every order or product change
+order_cache = ResponseCache("orders")
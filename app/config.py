@@ -6,10 +6,22 @@ for environment variables and application settings.
 """
 
 import os
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 from pydantic import AnyHttpUrl, Field, PostgresDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy.engine import make_url
+
+
+# Async drivers replacing the synchronous (default) drivers of each backend
+_ASYNC_DRIVERNAMES = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
 
 
 class Settings(BaseSettings):
@@ -25,20 +37,25 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = Field(default="Product and Order Management API", description="Name of the project")
     
     # CORS SETTINGS
-    BACKEND_CORS_ORIGINS: list[AnyHttpUrl] = Field(
-        default=["http://localhost:8000", "http://localhost:3000"],
+    BACKEND_CORS_ORIGINS: Tuple[str, ...] = Field(
+        default=("http://localhost:8000", "http://localhost:3000"),
         description="List of origins that can access the API"
     )
     
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     @classmethod
-    def assemble_cors_origins(cls, v: str | list[str]) -> list[str]:
-        """Parse CORS origins from string or list."""
+    def assemble_cors_origins(cls, v: str | list[str] | tuple[str, ...]) -> Tuple[str, ...]:
+        """
+        Parse CORS origins from a comma-separated string or a list.
+        
+        Each origin is checked as an HTTP URL once, here, and kept in the form
+        browsers send in the Origin header (no trailing slash).
+        """
         if isinstance(v, str) and not v.startswith("["):
-            return [i.strip() for i in v.split(",")]
-        elif isinstance(v, (list, str)):
-            return v
-        raise ValueError(v)
+            v = v.split(",")
+        elif not isinstance(v, (list, tuple)):
+            raise ValueError(v)
+        return tuple(str(AnyHttpUrl(origin.strip())).rstrip("/") for origin in v)
     
     # DATABASE SETTINGS
     DATABASE_URL: str = Field(
@@ -46,6 +63,45 @@ class Settings(BaseSettings):
         description="Database connection string"
     )
     
+    @field_validator("DATABASE_URL")
+    @classmethod
+    def use_async_driver(cls, v: str) -> str:
+        """Switch URLs using a synchronous driver to the backend's async driver."""
+        url = make_url(v)
+        drivername = _ASYNC_DRIVERNAMES.get(url.drivername)
+        if drivername is None:
+            return v
+        return url.set(drivername=drivername).render_as_string(hide_password=False)
+    
+    DB_POOL_SIZE: int = Field(
+        default=20,
+        description="Number of connections kept open in the database pool"
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=20,
+        description="Extra connections allowed beyond the pool size under load"
+    )
+    DB_POOL_TIMEOUT: int = Field(
+        default=30,
+        description="Seconds to wait for a free pooled connection before giving up"
+    )
+    DB_POOL_RECYCLE: int = Field(
+        default=1800,
+        description="Seconds after which pooled connections are recycled"
+    )
+    DB_QUERY_CACHE_SIZE: int = Field(
+        default=1200,
+        description="Number of compiled SQL statements cached by the engine"
+    )
+    DB_INSERTMANYVALUES_PAGE_SIZE: int = Field(
+        default=1000,
+        description="Rows sent per multi-row INSERT when inserting many rows at once"
+    )
+    DB_POOL_PRE_PING: bool = Field(
+        default=True,
+        description="Check pooled connections for liveness before use"
+    )
+    
     # SECURITY SETTINGS
     SECRET_KEY: str = Field(
         default="supersecretkey",
@@ -61,6 +117,24 @@ class Settings(BaseSettings):
         default=10,
         description="Default number of items per page in paginated responses"
     )
+    PAGINATION_MAX_PAGE_SIZE: int = Field(
+        default=100,
+        description="Upper bound accepted for the limit query parameter"
+    )
+    
+    # CACHE SETTINGS
+    CACHE_TTL_SECONDS: int = Field(
+        default=60,
+        description="Lifetime of cached GET responses in seconds (0 disables caching)"
+    )
+    CACHE_REDIS_URL: Optional[str] = Field(
+        default=None,
+        description="Redis URL for the response cache; caching is off when unset unless CACHE_IN_PROCESS is true"
+    )
+    CACHE_IN_PROCESS: bool = Field(
+        default=False,
+        description="Cache responses in process memory when CACHE_REDIS_URL is unset (single worker only)"
+    )
     
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -69,5 +143,20 @@ class Settings(BaseSettings):
     )
 
 
-# Create a global settings instance
-settings = Settings()
\ No newline at end of file
+# PUBLIC_INTERFACE
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, reading the environment on first use.
+    
+    Returns:
+        Settings: The shared settings instance
+    """
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the module-level ``settings`` lazily, so importing this module doesn't parse the environment."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,7 +1,6 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
-from fastapi.encoders import jsonable_encoder
+from typing import Any, AsyncIterator, Dict, Generic, List, Optional, Sequence, Set, Type, TypeVar, Union
 from pydantic import BaseModel
-from sqlalchemy import select, update, delete
+from sqlalchemy import delete, inspect, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import Base
@@ -28,6 +27,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             model: The SQLAlchemy model class
         """
         self.model = model
+        # Attribute names of the mapped columns, which are the updatable fields
+        self.column_keys = frozenset(attr.key for attr in inspect(model).column_attrs)
 
     # PUBLIC_INTERFACE
     async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
@@ -41,29 +42,103 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             The model instance if found, None otherwise
         """
-        query = select(self.model).where(self.model.id == id)
-        result = await db.execute(query)
-        return result.scalars().first()
+        # Served from the identity map when the record is already loaded
+        return await db.get(self.model, id)
+
+    # PUBLIC_INTERFACE
+    async def exists(self, db: AsyncSession, *, id: int) -> bool:
+        """
+        Check whether a record exists without loading it.
+        
+        Args:
+            db: Database session
+            id: ID of the record to check
+            
+        Returns:
+            True if the record exists, False otherwise
+        """
+        query = select(literal(1)).where(self.model.id == id).limit(1)
+        return await db.scalar(query) is not None
+
+    # PUBLIC_INTERFACE
+    async def get_existing_ids(self, db: AsyncSession, *, ids: Sequence[int]) -> Set[int]:
+        """
+        Find which of the given IDs exist with a single query.
+        
+        Args:
+            db: Database session
+            ids: IDs of the records to check
+            
+        Returns:
+            The subset of ids that exist
+        """
+        result = await db.scalars(select(self.model.id).where(self.model.id.in_(ids)))
+        return set(result)
 
     # PUBLIC_INTERFACE
     async def get_multi(
-        self, db: AsyncSession, *, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
     ) -> List[ModelType]:
         """
         Get multiple records with pagination.
         
+        Records are ordered by ID. When after_id is given, keyset pagination
+        is used and skip is ignored.
+        
         Args:
             db: Database session
             skip: Number of records to skip
             limit: Maximum number of records to return
+            after_id: Only return records with an ID greater than this one
             
         Returns:
             List of model instances
         """
-        query = select(self.model).offset(skip).limit(limit)
+        query = select(self.model).order_by(self.model.id).limit(limit)
+        if after_id is not None:
+            query = query.where(self.model.id > after_id)
+        else:
+            query = query.offset(skip)
         result = await db.execute(query)
         return result.scalars().all()
 
+    # PUBLIC_INTERFACE
+    async def iter_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
+    ) -> AsyncIterator[ModelType]:
+        """
+        Iterate over multiple records without materializing them all at once.
+        
+        Same paging as get_multi, but rows are streamed from the database
+        cursor. The session must stay open until the iteration is done.
+        
+        Args:
+            db: Database session
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            after_id: Only return records with an ID greater than this one
+            
+        Yields:
+            Model instances, ordered by ID
+        """
+        query = select(self.model).order_by(self.model.id).limit(limit)
+        if after_id is not None:
+            query = query.where(self.model.id > after_id)
+        else:
+            query = query.offset(skip)
+        async for obj in await db.stream_scalars(query):
+            yield obj
+
     # PUBLIC_INTERFACE
     async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
         """
@@ -76,7 +151,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             The created model instance
         """
-        obj_in_data = jsonable_encoder(obj_in)
+        obj_in_data = obj_in.model_dump()
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
         await db.commit()
@@ -102,22 +177,65 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             The updated model instance
         """
-        obj_data = jsonable_encoder(db_obj)
-        
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
             
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+        for field in update_data.keys() & self.column_keys:
+            setattr(db_obj, field, update_data[field])
                 
-        db.add(db_obj)
+        # db_obj belongs to this session, so the unit of work already tracks the changes
         await db.commit()
         await db.refresh(db_obj)
         return db_obj
 
+    # PUBLIC_INTERFACE
+    async def update_returning(
+        self,
+        db: AsyncSession,
+        *,
+        id: int,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        options: Sequence[Any] = ()
+    ) -> Optional[ModelType]:
+        """
+        Update a record by ID with a single UPDATE ... RETURNING statement.
+        
+        Args:
+            db: Database session
+            id: ID of the record to update
+            obj_in: Input data for updating the record
+            options: Loader options applied to the returned record, so its
+                relationships are loaded before the transaction is committed
+            
+        Returns:
+            The updated model instance if found, None otherwise
+        """
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+        
+        update_data = {field: value for field, value in update_data.items() if field in self.column_keys}
+        if not update_data:
+            # Nothing to change
+            return await db.get(self.model, id, options=options, populate_existing=True)
+        
+        query = (
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**update_data)
+            .returning(self.model)
+            .options(*options)
+            .execution_options(populate_existing=True)
+        )
+        result = await db.execute(query)
+        db_obj = result.scalar_one_or_none()
+        if db_obj is not None:
+            await db.commit()
+        return db_obj
+
     # PUBLIC_INTERFACE
     async def delete(self, db: AsyncSession, *, id: int) -> Optional[ModelType]:
         """
@@ -130,8 +248,9 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             The deleted model instance if found, None otherwise
         """
-        obj = await self.get(db=db, id=id)
-        if obj:
-            await db.delete(obj)
+        query = delete(self.model).where(self.model.id == id).returning(self.model)
+        result = await db.execute(query)
+        obj = result.scalar_one_or_none()
+        if obj is not None:
             await db.commit()
         return obj
\ No newline at end of file
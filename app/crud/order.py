@@ -1,16 +1,70 @@
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Union
 from decimal import Decimal
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, case, delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.exc import IntegrityError, OperationalError
 
 from app.crud.base import CRUDBase
 from app.models.order import Order, OrderItem, OrderStatus
+from app.models.product import Product
 from app.schemas.order import OrderCreate, OrderUpdate, OrderItemCreate
-from app.crud.product import product as product_crud
 from app.errors import OrderValidationError, ProductValidationError
 
+# Load an order's items via a single SELECT ... IN with their products joined
+# onto that item query. Any other relationship raises instead of lazy loading
+_WITH_ITEMS = (
+    selectinload(Order.items).joinedload(OrderItem.product),
+    raiseload("*"),
+)
+
+# Single-order reads join the items and their products onto the order row
+# instead, which takes one round trip
+_JOINED_ITEMS = (
+    joinedload(Order.items).joinedload(OrderItem.product),
+    raiseload("*"),
+)
+
+# Listing statements are built once; per call only the paging clauses are
+# added and the filter value is passed as a bound parameter
+_SELECT_BY_CUSTOMER_EMAIL = (
+    select(Order)
+    .options(
+        selectinload(Order.items).selectinload(OrderItem.product),
+        raiseload("*"),
+    )
+    .where(Order.customer_email == bindparam("email"))
+    .order_by(Order.id)
+)
+_SELECT_BY_STATUS = (
+    select(Order)
+    .options(raiseload("*"))
+    .where(Order.status == bindparam("status"))
+    .order_by(Order.id)
+)
+
+
+def _insufficient_inventory(
+    quantities: Dict[int, int], available: Dict[int, int]
+) -> List[Dict[str, int]]:
+    """List the ordered products whose available inventory is below the ordered quantity."""
+    return [
+        {"product_id": pid, "requested": quantity, "available": available[pid]}
+        for pid, quantity in quantities.items()
+        if pid in available and available[pid] < quantity
+    ]
+
+
+def _insufficient_inventory_error(insufficient_inventory: List[Dict[str, int]]) -> ProductValidationError:
+    """Build the error raised when ordered products are out of stock."""
+    return ProductValidationError(
+        detail="Insufficient inventory for one or more products",
+        product_ids=[item["product_id"] for item in insufficient_inventory],
+        error_type="insufficient_inventory",
+        validation_errors=insufficient_inventory
+    )
+
 
 class CRUDOrderItem(CRUDBase[OrderItem, OrderItemCreate, Dict[str, Any]]):
     """
@@ -20,98 +74,55 @@ class CRUDOrderItem(CRUDBase[OrderItem, OrderItemCreate, Dict[str, Any]]):
     """
     
     # PUBLIC_INTERFACE
-    async def create_with_order(
-        self, db: AsyncSession, *, obj_in: OrderItemCreate, order_id: int
-    ) -> OrderItem:
+    def price_items(
+        self, items: List[OrderItemCreate], products: Dict[int, Product]
+    ) -> List[Dict[str, Any]]:
         """
-        Create a new order item associated with an order.
+        Build the rows of order items, pricing each one once.
         
         Args:
-            db: Database session
-            obj_in: Input data for creating the order item
-            order_id: ID of the order to associate with
+            items: Input data for creating the order items
+            products: Ordered products keyed by ID, already loaded and validated
             
         Returns:
-            The created order item
-            
-        Raises:
-            ProductValidationError: If product validation fails
+            One row per item with its unit price and subtotal, without an order ID
         """
-        try:
-            # Get the product to get its current price
-            product_obj = await product_crud.get(db=db, id=obj_in.product_id)
-            
-            # Check if product exists
-            if not product_obj:
-                raise ProductValidationError(
-                    detail=f"Product with ID {obj_in.product_id} not found",
-                    product_ids=[obj_in.product_id],
-                    error_type="product_not_found",
-                    validation_errors=[{"msg": f"Product with ID {obj_in.product_id} not found"}]
-                )
-            
-            # Check if product has sufficient inventory
-            if product_obj.inventory_count < obj_in.quantity:
-                raise ProductValidationError(
-                    detail="Insufficient inventory",
-                    product_ids=[obj_in.product_id],
-                    error_type="insufficient_inventory",
-                    validation_errors=[{
-                        "product_id": obj_in.product_id,
-                        "requested": obj_in.quantity,
-                        "available": product_obj.inventory_count
-                    }]
-                )
-            
+        rows = []
+        for item in items:
             # Use the product's current price if not specified
-            unit_price = obj_in.unit_price if obj_in.unit_price else product_obj.price
-            
-            # Calculate subtotal
-            subtotal = unit_price * Decimal(obj_in.quantity)
-            
-            # Create order item
-            db_obj = OrderItem(
-                order_id=order_id,
-                product_id=obj_in.product_id,
-                quantity=obj_in.quantity,
-                unit_price=unit_price,
-                subtotal=subtotal
-            )
-            
-            db.add(db_obj)
-            
-            # Update product inventory
-            updated_product = await product_crud.update_inventory(
-                db=db, id=obj_in.product_id, quantity_change=-obj_in.quantity
-            )
-            
-            if not updated_product:
-                raise ProductValidationError(
-                    detail=f"Failed to update inventory for product {obj_in.product_id}",
-                    product_ids=[obj_in.product_id],
-                    error_type="inventory_update_failed",
-                    validation_errors=[{"msg": f"Failed to update inventory for product {obj_in.product_id}"}]
-                )
-                
-            # Flush to persist changes without committing the transaction
-            await db.flush()
-            
-            return db_obj
+            unit_price = item.unit_price if item.unit_price else products[item.product_id].price
+            rows.append({
+                "product_id": item.product_id,
+                "quantity": item.quantity,
+                "unit_price": unit_price,
+                "subtotal": unit_price * item.quantity,
+            })
+        return rows
+
+    # PUBLIC_INTERFACE
+    async def create_many_prefetched(
+        self, db: AsyncSession, *, rows: List[Dict[str, Any]], order_id: int
+    ) -> List[OrderItem]:
+        """
+        Insert the priced items of an order.
+        
+        The products are neither looked up nor touched here; the caller has
+        already validated them and updates their inventory. All items are
+        written with a single executemany INSERT.
+        
+        Args:
+            db: Database session
+            rows: Item rows built by price_items
+            order_id: ID of the order to associate with
             
-        except ProductValidationError:
-            # Re-raise ProductValidationError for specific handling
-            await db.rollback()
-            raise
-        except Exception as e:
-            # Rollback transaction on any error
-            await db.rollback()
-            # If inventory update fails, raise a ProductValidationError
-            raise ProductValidationError(
-                detail=f"Error creating order item: {str(e)}",
-                product_ids=[obj_in.product_id],
-                error_type="inventory_update_failed",
-                validation_errors=[{"msg": str(e)}]
-            )
+        Returns:
+            The created order items, in the order of the rows
+        """
+        for row in rows:
+            row["order_id"] = order_id
+        query = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await db.scalars(query, rows)
+        return result.all()
 
 
 class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
@@ -148,7 +159,7 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
     # PUBLIC_INTERFACE
     async def get_with_items(self, db: AsyncSession, id: int) -> Optional[Order]:
         """
-        Get an order by ID including its items.
+        Get an order by ID including its items and their products.
         
         Args:
             db: Database session
@@ -160,8 +171,7 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
         Raises:
             OrderValidationError: If order not found
         """
-        # First check if the order exists
-        order = await super().get(db=db, id=id)
+        order = await db.get(self.model, id, options=_JOINED_ITEMS, populate_existing=True)
         
         if not order:
             raise OrderValidationError(
@@ -169,15 +179,18 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
                 error_type="order_not_found",
                 validation_errors=[{"msg": f"Order with ID {id} not found"}]
             )
-        
-        # Refresh the order with its items to ensure it's attached to the session
-        await db.refresh(order, ["items"])
             
         return order
 
     # PUBLIC_INTERFACE
     async def get_by_customer_email(
-        self, db: AsyncSession, *, email: str, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        *,
+        email: str,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
     ) -> List[Order]:
         """
         Get orders by customer email with pagination.
@@ -185,20 +198,19 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
         Args:
             db: Database session
             email: Customer email to filter by
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after_id is given)
             limit: Maximum number of records to return
+            after_id: Only return orders with an ID greater than this one
             
         Returns:
             List of orders for the specified customer
         """
-        query = (
-            select(self.model)
-            .options(selectinload(self.model.items))
-            .where(self.model.customer_email == email)
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await db.execute(query)
+        query = _SELECT_BY_CUSTOMER_EMAIL.limit(limit)
+        if after_id is not None:
+            query = query.where(self.model.id > after_id)
+        else:
+            query = query.offset(skip)
+        result = await db.execute(query, {"email": email})
         orders = result.scalars().all()
         
         # No need to raise an exception if no orders found, just return empty list
@@ -206,7 +218,13 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
 
     # PUBLIC_INTERFACE
     async def get_by_status(
-        self, db: AsyncSession, *, status: OrderStatus, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        *,
+        status: OrderStatus,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
     ) -> List[Order]:
         """
         Get orders by status with pagination.
@@ -214,19 +232,19 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
         Args:
             db: Database session
             status: Order status to filter by
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after_id is given)
             limit: Maximum number of records to return
+            after_id: Only return orders with an ID greater than this one
             
         Returns:
             List of orders with the specified status
         """
-        query = (
-            select(self.model)
-            .where(self.model.status == status)
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await db.execute(query)
+        query = _SELECT_BY_STATUS.limit(limit)
+        if after_id is not None:
+            query = query.where(self.model.id > after_id)
+        else:
+            query = query.offset(skip)
+        result = await db.execute(query, {"status": status})
         return result.scalars().all()
 
     # PUBLIC_INTERFACE
@@ -247,107 +265,119 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
             OrderValidationError: If order validation fails
             ProductValidationError: If product validation fails
         """
-        try:
-            # Validate order has items
-            if not obj_in.items or len(obj_in.items) == 0:
-                raise OrderValidationError(
-                    detail="Order must contain at least one item",
-                    error_type="empty_order",
-                    validation_errors=[{"msg": "Order must contain at least one item"}]
-                )
-                
-            # Create order without items first
-            order_data = obj_in.model_dump(exclude={"items"})
+        # Validate order has items
+        if not obj_in.items or len(obj_in.items) == 0:
+            raise OrderValidationError(
+                detail="Order must contain at least one item",
+                error_type="empty_order",
+                validation_errors=[{"msg": "Order must contain at least one item"}]
+            )
             
-            # Set initial status to pending if not provided
-            if "status" not in order_data:
-                order_data["status"] = OrderStatus.PENDING
-                
-            # Calculate total amount from items and validate products
-            total_amount = Decimal(0)
-            invalid_products = []
-            insufficient_inventory = []
+        # Create order without items first
+        order_data = obj_in.model_dump(exclude={"items"})
+        
+        # Set initial status to pending if not provided
+        if "status" not in order_data:
+            order_data["status"] = OrderStatus.PENDING
+            
+        # Load all ordered products with one SELECT ... IN
+        quantities: Dict[int, int] = {}
+        for item in obj_in.items:
+            quantities[item.product_id] = quantities.get(item.product_id, 0) + item.quantity
+        result = await db.execute(select(Product).where(Product.id.in_(quantities)))
+        products = {product_obj.id: product_obj for product_obj in result.scalars().all()}
+        
+        # Validate all products before making any changes
+        invalid_products = [pid for pid in quantities if pid not in products]
+        insufficient_inventory = _insufficient_inventory(
+            quantities, {pid: product_obj.inventory_count for pid, product_obj in products.items()}
+        )
+        
+        # Handle validation errors
+        if invalid_products:
+            raise ProductValidationError(
+                detail=f"One or more products not found",
+                product_ids=invalid_products,
+                error_type="product_not_found",
+                validation_errors=[{"msg": f"Product with ID {pid} not found"} for pid in invalid_products]
+            )
             
-            # Pre-validate all products before making any changes
-            for item in obj_in.items:
-                product_obj = await product_crud.get(db=db, id=item.product_id)
-                
-                # Check if product exists
-                if not product_obj:
-                    invalid_products.append(item.product_id)
-                    continue
-                    
-                # Check if product has sufficient inventory
-                if product_obj.inventory_count < item.quantity:
-                    insufficient_inventory.append({
-                        "product_id": item.product_id,
-                        "requested": item.quantity,
-                        "available": product_obj.inventory_count
-                    })
-                    continue
-                    
-                # Use the product's current price if not specified
-                unit_price = item.unit_price if item.unit_price else product_obj.price
-                item_total = unit_price * Decimal(item.quantity)
-                total_amount += item_total
+        if insufficient_inventory:
+            raise _insufficient_inventory_error(insufficient_inventory)
+        
+        # Price every item once; the order total is the sum of their subtotals
+        item_rows = order_item.price_items(obj_in.items, products)
+        total_amount = sum((row["subtotal"] for row in item_rows), Decimal(0))
             
-            # Handle validation errors
-            if invalid_products:
-                raise ProductValidationError(
-                    detail=f"One or more products not found",
-                    product_ids=invalid_products,
-                    error_type="product_not_found",
-                    validation_errors=[{"msg": f"Product with ID {pid} not found"} for pid in invalid_products]
-                )
-                
-            if insufficient_inventory:
-                raise ProductValidationError(
-                    detail="Insufficient inventory for one or more products",
-                    product_ids=[item["product_id"] for item in insufficient_inventory],
-                    error_type="insufficient_inventory",
-                    validation_errors=insufficient_inventory
-                )
-                
+        try:
             # Create the order
             db_obj = Order(**order_data, total_amount=total_amount)
             db.add(db_obj)
             await db.flush()  # Flush to get the order ID but don't commit yet
             
-            # Create order items
-            order_item_crud = CRUDOrderItem(OrderItem)
-            for item in obj_in.items:
-                await order_item_crud.create_with_order(
-                    db=db, obj_in=item, order_id=db_obj.id
+            # Create order items and attach them, with their already loaded
+            # products, to the new order so it needs no reload
+            items = await order_item.create_many_prefetched(db=db, rows=item_rows, order_id=db_obj.id)
+            for item in items:
+                set_committed_value(item, "product", products[item.product_id])
+            set_committed_value(db_obj, "items", items)
+            
+            # Take the ordered quantities off the inventory with a single UPDATE;
+            # it skips products whose stock was taken by a concurrent order since
+            # the check above, so they can't be oversold
+            ordered_quantity = case(quantities, value=Product.id)
+            result = await db.execute(
+                update(Product)
+                .where(Product.id.in_(quantities), Product.inventory_count >= ordered_quantity)
+                .values(inventory_count=Product.inventory_count - ordered_quantity)
+            )
+            if result.rowcount != len(quantities):
+                available = await db.execute(
+                    select(Product.id, Product.inventory_count).where(Product.id.in_(quantities))
                 )
-                
-            # Commit the transaction after all operations are successful
-            await db.commit()
+                insufficient_inventory = _insufficient_inventory(quantities, dict(available.tuples().all()))
+                await db.rollback()
+                raise _insufficient_inventory_error(insufficient_inventory)
             
-            # Refresh the order with its items
-            await db.refresh(db_obj, ["items"])
-            
-            return db_obj
-            
-        except (OrderValidationError, ProductValidationError):
-            # Re-raise specific validation errors
-            await db.rollback()
-            raise
-        except SQLAlchemyError as e:
-            # Handle SQLAlchemy specific errors
+            # The whole request runs in a single transaction
+            await db.commit()
+        except (IntegrityError, OperationalError) as e:
+            # Other exceptions are left to get_db, which rolls the session back
             await db.rollback()
             raise OrderValidationError(
                 detail=f"Database error while creating order: {str(e)}",
                 error_type="database_error",
                 validation_errors=[{"msg": str(e)}]
             )
-        except Exception as e:
-            # Handle any other unexpected errors
-            await db.rollback()
+        
+        return db_obj
+
+    # PUBLIC_INTERFACE
+    async def update_by_id(
+        self, db: AsyncSession, *, id: int, obj_in: Union[OrderUpdate, Dict[str, Any]]
+    ) -> Order:
+        """
+        Update an order by ID without loading it first.
+        
+        Args:
+            db: Database session
+            id: Order ID
+            obj_in: Input data for updating the order
+            
+        Returns:
+            The updated order with its items and their products
+            
+        Raises:
+            OrderValidationError: If order not found
+        """
+        order = await self.update_returning(db, id=id, obj_in=obj_in, options=_WITH_ITEMS)
+        if order is None:
             raise OrderValidationError(
-                detail=f"Error creating order: {str(e)}",
-                error_type="order_creation_failed",
-                validation_errors=[{"msg": str(e)}]
+                detail=f"Order with ID {id} not found",
+                error_type="order_not_found",
+                validation_errors=[{"msg": f"Order with ID {id} not found"}]
             )
+        return order
 
     # PUBLIC_INTERFACE
     async def update_status(
@@ -362,31 +392,43 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
             status: New order status
             
         Returns:
-            The updated order if found, None otherwise
+            The updated order with its items and their products
             
         Raises:
             OrderValidationError: If order validation fails
         """
         try:
-            order = await self.get(db=db, id=id)
-                
-            # Validate status transition
-            # For example, you might want to prevent changing from DELIVERED back to PENDING
-            if order.status == OrderStatus.DELIVERED and status == OrderStatus.PENDING:
+            # Single UPDATE ... RETURNING on the hot path; the DELIVERED -> PENDING
+            # guard is folded into the WHERE clause instead of loading the order first.
+            # Items and their products are loaded from the returned order right away
+            query = update(self.model).where(self.model.id == id)
+            if status == OrderStatus.PENDING:
+                query = query.where(self.model.status != OrderStatus.DELIVERED)
+            query = (
+                query.values(status=status)
+                .returning(self.model)
+                .options(*_WITH_ITEMS)
+                .execution_options(populate_existing=True)
+            )
+            
+            result = await db.execute(query)
+            order = result.scalar_one_or_none()
+            
+            if order is None:
+                # Nothing was updated: find out whether the order is missing
+                # (raises order_not_found) or the transition was rejected
+                current = await self.get(db=db, id=id)
                 raise OrderValidationError(
                     detail="Cannot change order status from DELIVERED to PENDING",
                     error_type="invalid_status_transition",
                     validation_errors=[{
                         "msg": "Invalid status transition",
-                        "current_status": order.status.value,
+                        "current_status": current.status.value,
                         "requested_status": status.value
                     }]
                 )
                 
-            order.status = status
-            db.add(order)
             await db.commit()
-            await db.refresh(order)
             return order
             
         except OrderValidationError:
@@ -416,21 +458,33 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
             OrderValidationError: If order not found
         """
         try:
-            order = await self.get(db=db, id=id)
+            # Delete in a single statement unless the order has been shipped or
+            # delivered; its items are removed by the ON DELETE CASCADE
+            query = (
+                delete(Order)
+                .where(
+                    Order.id == id,
+                    Order.status.notin_([OrderStatus.SHIPPED, OrderStatus.DELIVERED]),
+                )
+                .returning(Order)
+            )
+            result = await db.execute(query)
+            order = result.scalar_one_or_none()
             
-            # Check if the order can be deleted (e.g., not already shipped)
-            if order.status in [OrderStatus.SHIPPED, OrderStatus.DELIVERED]:
+            if order is None:
+                # Nothing was deleted; raises order_not_found if the order doesn't exist
+                current = await self.get(db=db, id=id)
                 raise OrderValidationError(
-                    detail=f"Cannot delete order with status {order.status.value}",
+                    detail=f"Cannot delete order with status {current.status.value}",
                     error_type="invalid_order_deletion",
                     validation_errors=[{
                         "msg": "Cannot delete order that has been shipped or delivered",
-                        "current_status": order.status.value
+                        "current_status": current.status.value
                     }]
                 )
                 
-            await db.delete(order)
             await db.commit()
+            set_committed_value(order, "items", [])
             return order
             
         except OrderValidationError:
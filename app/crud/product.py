@@ -1,11 +1,40 @@
-from typing import List, Optional, Dict, Any
-from sqlalchemy import select, func
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence
+from sqlalchemy import Boolean, ColumnElement, Row, Select, bindparam, case, exists, func, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.base import CRUDBase
+from app.errors import ConflictError
+from app.models.order import OrderItem
 from app.models.product import Product
 from app.schemas.product import ProductCreate, ProductUpdate
 
+# Rows buffered per fetch when streaming listings
+STREAM_BATCH_SIZE = 100
+
+
+def _escape_like(value: str) -> str:
+    """Escape the LIKE wildcards in user input so they match literally (escape character: backslash)."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# Fixed-shape statements for the SKU lookup, the category listing and the
+# search; callers bind the SKU, category or lowercased LIKE pattern and add
+# the paging
+_SELECT_BY_SKU = select(Product).where(Product.sku == bindparam("sku"))
+_SELECT_BY_CATEGORY = (
+    select(Product)
+    .where(Product.category == bindparam("category"))
+    .order_by(Product.id)
+)
+_SEARCH_NAME_OR_DESCRIPTION = (
+    select(Product)
+    .where(
+        (func.lower(Product.name).like(bindparam("pattern"), escape="\\")) |
+        (func.lower(Product.description).like(bindparam("pattern"), escape="\\"))
+    )
+    .order_by(Product.id)
+)
+
 
 class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
     """
@@ -26,13 +55,64 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
         Returns:
             The product if found, None otherwise
         """
-        query = select(self.model).where(self.model.sku == sku)
+        # sku is unique, so this is a single probe of its unique index
+        return await db.scalar(_SELECT_BY_SKU, {"sku": sku})
+
+    # PUBLIC_INTERFACE
+    async def get_multi_summaries(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        after_id: Optional[int] = None
+    ) -> Sequence[Row]:
+        """
+        Get the summary columns of multiple products with pagination.
+        
+        Only the columns of ProductSummary are selected and no ORM objects are
+        built, which keeps product listings cheap.
+        
+        Args:
+            db: Database session
+            skip: Number of records to skip (ignored when after_id is given)
+            limit: Maximum number of records to return
+            filters: Column values the products must match, e.g. {"is_active": True}
+            after_id: Only return products with an ID greater than this one
+            
+        Returns:
+            Rows with the id, name, sku and price of each product
+        """
+        query = (
+            select(self.model.id, self.model.name, self.model.sku, self.model.price)
+            .where(*(self._filter_clause(field, value) for field, value in (filters or {}).items()))
+            .order_by(self.model.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            query = query.where(self.model.id > after_id)
+        else:
+            query = query.offset(skip)
         result = await db.execute(query)
-        return result.scalars().first()
+        return result.all()
+
+    def _filter_clause(self, field: str, value: Any) -> ColumnElement[bool]:
+        """Build an equality filter; flags are inlined so partial indexes on them can be used."""
+        column = getattr(self.model, field)
+        if isinstance(value, bool):
+            return column == literal(value, Boolean, literal_execute=True)
+        return column == value
 
     # PUBLIC_INTERFACE
     async def get_by_category(
-        self, db: AsyncSession, *, category: str, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        *,
+        category: str,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
     ) -> List[Product]:
         """
         Get products by category with pagination.
@@ -40,21 +120,59 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
         Args:
             db: Database session
             category: Category to filter by
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after_id is given)
             limit: Maximum number of records to return
+            after_id: Only return products with an ID greater than this one
             
         Returns:
-            List of products in the specified category
+            List of products in the specified category, ordered by ID
         """
-        query = (
-            select(self.model)
-            .where(self.model.category == category)
-            .offset(skip)
-            .limit(limit)
-        )
+        query = self._category_query(category=category, skip=skip, limit=limit, after_id=after_id)
         result = await db.execute(query)
         return result.scalars().all()
 
+    # PUBLIC_INTERFACE
+    async def iter_by_category(
+        self,
+        db: AsyncSession,
+        *,
+        category: str,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
+    ) -> AsyncIterator[Product]:
+        """
+        Stream products by category, fetching STREAM_BATCH_SIZE rows at a time.
+        
+        The caller must consume the iterator while the session is still open.
+        
+        Args:
+            db: Database session
+            category: Category to filter by
+            skip: Number of records to skip (ignored when after_id is given)
+            limit: Maximum number of records to return
+            after_id: Only return products with an ID greater than this one
+            
+        Yields:
+            Products in the specified category, ordered by ID
+        """
+        query = self._category_query(category=category, skip=skip, limit=limit, after_id=after_id)
+        async for product in await db.stream_scalars(
+            query.execution_options(yield_per=STREAM_BATCH_SIZE)
+        ):
+            yield product
+
+    def _category_query(
+        self, *, category: str, skip: int, limit: int, after_id: Optional[int]
+    ) -> Select:
+        """Build the category page query with its parameters bound."""
+        query = _SELECT_BY_CATEGORY.limit(limit)
+        if after_id is not None:
+            query = query.where(self.model.id > after_id)
+        else:
+            query = query.offset(skip)
+        return query.params(category=category)
+
     # PUBLIC_INTERFACE
     async def get_active(
         self, db: AsyncSession, *, skip: int = 0, limit: int = 100
@@ -68,11 +186,12 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
             limit: Maximum number of records to return
             
         Returns:
-            List of active products
+            List of active products, ordered by ID
         """
         query = (
             select(self.model)
-            .where(self.model.is_active == True)
+            .where(self._filter_clause("is_active", True))
+            .order_by(self.model.id)
             .offset(skip)
             .limit(limit)
         )
@@ -94,60 +213,121 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
         Returns:
             Updated product if found, None otherwise
         """
-        product = await self.get(db=db, id=id)
-        if not product:
-            return None
-            
-        # Ensure inventory doesn't go below zero
-        new_count = max(0, product.inventory_count + quantity_change)
-        product.inventory_count = new_count
-        
-        db.add(product)
-        await db.commit()
-        await db.refresh(product)
+        # One atomic UPDATE ... RETURNING; the count is clamped at zero in SQL,
+        # so concurrent changes can't be lost between a read and the write
+        new_count = self.model.inventory_count + quantity_change
+        query = (
+            update(self.model)
+            .where(self.model.id == id)
+            .values(inventory_count=case((new_count < 0, 0), else_=new_count))
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        result = await db.execute(query)
+        product = result.scalar_one_or_none()
+        if product is not None:
+            await db.commit()
         return product
 
     # PUBLIC_INTERFACE
     async def search_products(
-        self, db: AsyncSession, *, query: str, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        *,
+        query: str,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
     ) -> List[Product]:
         """
         Search products by name or description.
         
+        The query matches anywhere in the name or description. On PostgreSQL the
+        trigram indexes serve queries of three or more characters; shorter ones
+        fall back to a scan.
+        
         Args:
             db: Database session
             query: Search query string
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after_id is given)
             limit: Maximum number of records to return
+            after_id: Only return products with an ID greater than this one
             
         Returns:
-            List of products matching the search query
+            List of products matching the search query, ordered by ID
         """
-        search_pattern = f"%{query}%"
-        query = (
-            select(self.model)
-            .where(
-                (func.lower(self.model.name).like(func.lower(search_pattern))) |
-                (func.lower(self.model.description).like(func.lower(search_pattern)))
-            )
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await db.execute(query)
+        statement = self._search_query(query=query, skip=skip, limit=limit, after_id=after_id)
+        result = await db.execute(statement)
         return result.scalars().all()
 
+    # PUBLIC_INTERFACE
+    async def iter_search(
+        self,
+        db: AsyncSession,
+        *,
+        query: str,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
+    ) -> AsyncIterator[Product]:
+        """
+        Search products by name or description, streaming STREAM_BATCH_SIZE rows at a time.
+        
+        The query matches anywhere in the name or description. On PostgreSQL the
+        trigram indexes serve queries of three or more characters; shorter ones
+        fall back to a scan. The caller must consume the iterator while the
+        session is still open.
+        
+        Args:
+            db: Database session
+            query: Search query string
+            skip: Number of records to skip (ignored when after_id is given)
+            limit: Maximum number of records to return
+            after_id: Only return products with an ID greater than this one
+            
+        Yields:
+            Products matching the search query, ordered by ID
+        """
+        statement = self._search_query(query=query, skip=skip, limit=limit, after_id=after_id)
+        async for product in await db.stream_scalars(
+            statement.execution_options(yield_per=STREAM_BATCH_SIZE)
+        ):
+            yield product
+
+    def _search_query(
+        self, *, query: str, skip: int, limit: int, after_id: Optional[int]
+    ) -> Select:
+        """Build the search page query with its pattern bound."""
+        search_pattern = f"%{_escape_like(query.lower())}%"
+        statement = _SEARCH_NAME_OR_DESCRIPTION.limit(limit)
+        if after_id is not None:
+            statement = statement.where(self.model.id > after_id)
+        else:
+            statement = statement.offset(skip)
+        return statement.params(pattern=search_pattern)
+
     # PUBLIC_INTERFACE
     async def remove(self, db: AsyncSession, *, id: int) -> Optional[Product]:
         """
         Remove a product by ID.
         
+        Products referenced by order items are kept, so existing orders stay intact.
+        
         Args:
             db: Database session
             id: Product ID
             
         Returns:
             The removed product if found, None otherwise
+            
+        Raises:
+            ConflictError: If the product is referenced by orders
         """
+        if await db.scalar(select(exists().where(OrderItem.product_id == id))):
+            raise ConflictError(
+                detail=f"Product with ID {id} is referenced by orders",
+                code="product_in_use"
+            )
         return await self.delete(db, id=id)
 
 
@@ -5,24 +5,131 @@ This module provides SQLAlchemy setup with engine, session management,
 and Base class for models.
 """
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, ORMExecuteState, Session, raiseload
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 
 
-# Create async engine for SQLite
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True,
-)
+def _engine_options(database_url: str) -> Dict[str, Any]:
+    """
+    Build the keyword arguments for the async engine.
+    
+    Args:
+        database_url: Database connection string
+        
+    Returns:
+        Dict[str, Any]: Options for create_async_engine
+    """
+    options: Dict[str, Any] = {
+        # Logging every statement is far too costly to ever run in production
+        "echo": settings.DEBUG and settings.ENV != "production",
+        "future": True,
+        "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+        # Batches bulk INSERT ... RETURNING, such as the items of a new order
+        "insertmanyvalues_page_size": settings.DB_INSERTMANYVALUES_PAGE_SIZE,
+    }
+    
+    url = make_url(database_url)
+    if url.get_driver_name() == "asyncpg":
+        # The PostgreSQL JIT costs more than it saves on short OLTP queries
+        options["connect_args"] = {"server_settings": {"jit": "off"}}
+    
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory SQLite lives on a single static connection; there is no pool to size
+        return options
+    
+    options.update(
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    return options
+
+
+# PUBLIC_INTERFACE
+def enable_sqlite_foreign_keys(engine: AsyncEngine) -> None:
+    """
+    Turn on foreign key enforcement for every new SQLite connection.
+    
+    SQLite ignores foreign keys unless asked to, which would leave the
+    ON DELETE CASCADE clauses of the schema without effect. Engines of
+    other backends are left untouched.
+    
+    Args:
+        engine: Async engine to configure
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+# PUBLIC_INTERFACE
+def enable_sqlite_wal(engine: AsyncEngine) -> None:
+    """
+    Put file-based SQLite databases in write-ahead logging mode.
+    
+    With WAL, readers no longer block the writer and vice versa, and
+    synchronous=NORMAL only syncs at checkpoints instead of on every commit.
+    In-memory databases and engines of other backends are left untouched.
+    
+    Args:
+        engine: Async engine to configure
+    """
+    url = engine.url
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        return
+    
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_wal(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
+def _raise_on_lazy_load(execute_state: ORMExecuteState) -> None:
+    """
+    Make relationships not loaded by a query raise instead of lazy loading.
+    
+    Args:
+        execute_state: State of the ORM statement about to be executed
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+    ):
+        execute_state.statement = execute_state.statement.options(raiseload("*"))
+
+
+# Outside production, an accidental lazy load (an N+1 query) fails loudly
+if settings.ENV in ("development", "testing"):
+    event.listen(Session, "do_orm_execute", _raise_on_lazy_load)
+
+
+# Create async engine with a bounded connection pool
+engine = create_async_engine(settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL))
+enable_sqlite_foreign_keys(engine)
+enable_sqlite_wal(engine)
 
 # Create async session factory
 async_session_factory = async_sessionmaker(
@@ -43,6 +150,10 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for database session.
     
+    The CRUD methods commit their own writes, so the session is only
+    committed here if changes are still pending in it. Read-only requests
+    skip the COMMIT round trip; their transaction is rolled back on close.
+    
     Yields:
         AsyncSession: SQLAlchemy async session
     
@@ -57,7 +168,8 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
         try:
             yield session
-            await session.commit()
+            if session.new or session.dirty or session.deleted:
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -65,6 +177,27 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# Read-only sessions run each statement in autocommit mode, so a GET request
+# does not pay for a BEGIN/COMMIT pair around its SELECTs
+_READ_ONLY_OPTIONS = {"isolation_level": "AUTOCOMMIT", "postgresql_readonly": True}
+
+
+# PUBLIC_INTERFACE
+async def get_ro_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for a read-only database session.
+    
+    Use it on endpoints that never write; anything flushed through this
+    session is not committed as one transaction, so writes belong on get_db.
+    
+    Yields:
+        AsyncSession: SQLAlchemy async session in autocommit mode
+    """
+    async with async_session_factory() as session:
+        await session.connection(execution_options=_READ_ONLY_OPTIONS)
+        yield session
+
+
 # PUBLIC_INTERFACE
 async def init_db() -> None:
     """
@@ -5,82 +5,99 @@ This module provides common dependencies used across API routes,
 including database sessions, pagination parameters, and authentication.
 """
 
-from typing import Annotated, AsyncGenerator, Optional, Tuple
+from os import urandom
+from typing import Annotated, AsyncGenerator, Iterable, NamedTuple, Optional
 
 from fastapi import Depends, Header, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import get_db
+from app.crud.order import order as order_crud
+from app.crud.product import product as product_crud
+from app.database import get_db, get_ro_db
+
+
+class PageParams(NamedTuple):
+    """Offset pagination parameters of a list request."""
+    skip: int
+    limit: int
+
+
+class SortOrder(NamedTuple):
+    """Sorting parameters of a list request."""
+    sort_by: Optional[str]
+    sort_desc: bool
 
 
 # PUBLIC_INTERFACE
-def get_pagination_params(
+async def get_pagination_params(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(
         settings.PAGINATION_PAGE_SIZE,
         ge=1,
-        le=100,
+        le=settings.PAGINATION_MAX_PAGE_SIZE,
         description="Number of items to return"
     ),
-) -> Tuple[int, int]:
+) -> PageParams:
     """
     Get pagination parameters from query parameters.
     
+    Declared async so FastAPI calls it inline instead of in its threadpool.
+    
     Args:
         skip: Number of items to skip (for pagination)
         limit: Maximum number of items to return
         
     Returns:
-        Tuple[int, int]: Tuple containing skip and limit values
+        PageParams: Named tuple of the skip and limit values
         
     Example:
         ```python
         @router.get("/items/")
         async def list_items(
-            pagination: Tuple[int, int] = Depends(get_pagination_params),
+            pagination: PaginationParams,
             db: AsyncSession = Depends(get_db)
         ):
-            skip, limit = pagination
-            # Use skip and limit for pagination
+            # Use pagination.skip and pagination.limit for pagination
             pass
         ```
     """
-    return skip, limit
+    return PageParams(skip, limit)
 
 
 # PUBLIC_INTERFACE
-def get_sort_params(
+async def get_sort_params(
     sort_by: Optional[str] = Query(None, description="Field to sort by"),
     sort_desc: bool = Query(False, description="Sort in descending order"),
-) -> Tuple[Optional[str], bool]:
+) -> SortOrder:
     """
     Get sorting parameters from query parameters.
     
+    Declared async for the same reason as get_pagination_params.
+    
     Args:
         sort_by: Field to sort by
         sort_desc: Sort in descending order if true
         
     Returns:
-        Tuple[Optional[str], bool]: Tuple containing sort_by and sort_desc values
+        SortOrder: Named tuple of the sort_by and sort_desc values
         
     Example:
         ```python
         @router.get("/items/")
         async def list_items(
-            sort_params: Tuple[Optional[str], bool] = Depends(get_sort_params),
+            sort_params: SortParams,
             db: AsyncSession = Depends(get_db)
         ):
-            sort_by, sort_desc = sort_params
-            # Use sort_by and sort_desc for sorting
+            # Use sort_params.sort_by and sort_params.sort_desc for sorting
             pass
         ```
     """
-    return sort_by, sort_desc
+    return SortOrder(sort_by, sort_desc)
 
 
 # PUBLIC_INTERFACE
-def get_correlation_id(
+async def get_correlation_id(
     x_correlation_id: Optional[str] = Header(None, description="Correlation ID for request tracing")
 ) -> str:
     """
@@ -90,7 +107,7 @@ def get_correlation_id(
         x_correlation_id: Correlation ID from request header
         
     Returns:
-        str: Correlation ID (from header or generated)
+        str: Correlation ID (from header, or 32 random hex characters)
         
     Example:
         ```python
@@ -103,22 +120,19 @@ def get_correlation_id(
             pass
         ```
     """
-    import uuid
-    
-    if x_correlation_id:
-        return x_correlation_id
-    return str(uuid.uuid4())
+    return x_correlation_id or urandom(16).hex()
 
 
 # Type aliases for common dependencies
 DBSession = Annotated[AsyncSession, Depends(get_db)]
-PaginationParams = Annotated[Tuple[int, int], Depends(get_pagination_params)]
-SortParams = Annotated[Tuple[Optional[str], bool], Depends(get_sort_params)]
+ReadOnlyDBSession = Annotated[AsyncSession, Depends(get_ro_db)]
+PaginationParams = Annotated[PageParams, Depends(get_pagination_params)]
+SortParams = Annotated[SortOrder, Depends(get_sort_params)]
 CorrelationId = Annotated[str, Depends(get_correlation_id)]
 
 
 # PUBLIC_INTERFACE
-def validate_product_exists(product_id: int, db: DBSession) -> None:
+async def validate_product_exists(product_id: int, db: DBSession) -> None:
     """
     Validate that a product exists.
     
@@ -141,10 +155,7 @@ def validate_product_exists(product_id: int, db: DBSession) -> None:
             pass
         ```
     """
-    from app.crud.product import product as product_crud
-    
-    product = await product_crud.get(db, id=product_id)
-    if not product:
+    if not await product_crud.exists(db, id=product_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Product with ID {product_id} not found"
@@ -152,7 +163,40 @@ def validate_product_exists(product_id: int, db: DBSession) -> None:
 
 
 # PUBLIC_INTERFACE
-def validate_order_exists(order_id: int, db: DBSession) -> None:
+async def validate_products_exist(product_ids: Iterable[int], db: DBSession) -> None:
+    """
+    Validate that several products exist, with a single query.
+    
+    Args:
+        product_ids: IDs of the products to validate
+        db: Database session
+        
+    Raises:
+        HTTPException: If any of the products does not exist
+        
+    Example:
+        ```python
+        @router.post("/bundles/")
+        async def create_bundle(
+            bundle_in: BundleCreate,
+            db: AsyncSession = Depends(get_db)
+        ):
+            await validate_products_exist(bundle_in.product_ids, db)
+            # Continue with operation
+            pass
+        ```
+    """
+    product_ids = set(product_ids)
+    missing = product_ids - await product_crud.get_existing_ids(db, ids=list(product_ids))
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Missing product IDs: {sorted(missing)}"
+        )
+
+
+# PUBLIC_INTERFACE
+async def validate_order_exists(order_id: int, db: DBSession) -> None:
     """
     Validate that an order exists.
     
@@ -175,10 +219,7 @@ def validate_order_exists(order_id: int, db: DBSession) -> None:
             pass
         ```
     """
-    from app.crud.order import order as order_crud
-    
-    order = await order_crud.get(db, id=order_id)
-    if not order:
+    if not await order_crud.exists(db, id=order_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Order with ID {order_id} not found"
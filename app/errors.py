@@ -9,13 +9,12 @@ import logging
 from typing import Any, Dict, List, Optional, Union
 
 from fastapi import FastAPI, Request, status
-from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from app import __app_name__
+from app.responses import AppORJSONResponse
 
 
 logger = logging.getLogger(__app_name__)
@@ -234,7 +233,7 @@ class ProductValidationError(APIError):
         )
 
 
-class ValidationErrorResponse(JSONResponse):
+class ValidationErrorResponse(AppORJSONResponse):
     """
     Custom response for validation errors.
     
@@ -254,6 +253,23 @@ class ValidationErrorResponse(JSONResponse):
         )
 
 
+def _get_correlation_id(request: Request) -> Optional[str]:
+    """Return the correlation ID set on the request by the logging middleware, if any."""
+    return getattr(request.state, "correlation_id", None)
+
+
+def _format_errors(exc: Union[RequestValidationError, ValidationError]) -> List[Dict[str, Any]]:
+    """Reduce validation error entries to their location, message, and type."""
+    return [
+        {
+            "loc": error.get("loc", []),
+            "msg": error.get("msg", ""),
+            "type": error.get("type", ""),
+        }
+        for error in exc.errors()
+    ]
+
+
 # PUBLIC_INTERFACE
 def setup_exception_handlers(app: FastAPI) -> None:
     """
@@ -270,16 +286,13 @@ def setup_exception_handlers(app: FastAPI) -> None:
     """
     
     @app.exception_handler(APIError)
-    async def api_error_handler(request: Request, exc: APIError) -> JSONResponse:
+    async def api_error_handler(request: Request, exc: APIError) -> AppORJSONResponse:
         """Handle custom API errors."""
-        # Get correlation ID from request state if available
-        correlation_id = getattr(request.state, "correlation_id", None)
+        correlation_id = _get_correlation_id(request)
         
-        # Log the error
         logger.error(
-            f"API Error: {exc.detail} "
-            f"(status_code: {exc.status_code}, code: {exc.code}, "
-            f"correlation_id: {correlation_id})"
+            "API Error: %s (status_code: %s, code: %s, correlation_id: %s)",
+            exc.detail, exc.status_code, exc.code, correlation_id,
         )
         
         # Create base error response
@@ -289,84 +302,33 @@ def setup_exception_handlers(app: FastAPI) -> None:
             "correlation_id": correlation_id,
         }
         
-        # Add additional fields for OrderValidationError
-        if isinstance(exc, OrderValidationError):
-            error_response["product_ids"] = exc.product_ids
-            error_response["error_type"] = exc.error_type
-            error_response["validation_errors"] = exc.validation_errors
-        
-        # Add additional fields for ProductValidationError
-        elif isinstance(exc, ProductValidationError):
+        # Add additional fields for order and product validation errors
+        if isinstance(exc, (OrderValidationError, ProductValidationError)):
             error_response["product_ids"] = exc.product_ids
             error_response["error_type"] = exc.error_type
             error_response["validation_errors"] = exc.validation_errors
         
         # Return JSON response
-        return JSONResponse(
+        return AppORJSONResponse(
             status_code=exc.status_code,
-            content={"error": jsonable_encoder(error_response)},
+            content={"error": error_response},
             headers=exc.headers,
         )
     
+    # Request and Pydantic validation errors share one handler and response shape
     @app.exception_handler(RequestValidationError)
-    async def validation_error_handler(
-        request: Request, exc: RequestValidationError
-    ) -> ValidationErrorResponse:
-        """Handle request validation errors."""
-        # Get correlation ID from request state if available
-        correlation_id = getattr(request.state, "correlation_id", None)
-        
-        # Format validation errors
-        errors = []
-        for error in exc.errors():
-            error_detail = {
-                "loc": error.get("loc", []),
-                "msg": error.get("msg", ""),
-                "type": error.get("type", ""),
-            }
-            errors.append(error_detail)
-        
-        # Log the error
-        logger.error(
-            f"Validation Error: {errors} "
-            f"(correlation_id: {correlation_id})"
-        )
-        
-        # Return JSON response
-        return ValidationErrorResponse(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content={
-                "error": {
-                    "code": "validation_error",
-                    "message": "Validation error",
-                    "errors": errors,
-                    "correlation_id": correlation_id,
-                }
-            },
-        )
-    
     @app.exception_handler(ValidationError)
-    async def pydantic_validation_error_handler(
-        request: Request, exc: ValidationError
+    async def validation_error_handler(
+        request: Request, exc: Union[RequestValidationError, ValidationError]
     ) -> ValidationErrorResponse:
-        """Handle Pydantic validation errors."""
-        # Get correlation ID from request state if available
-        correlation_id = getattr(request.state, "correlation_id", None)
+        """Handle request and Pydantic validation errors."""
+        correlation_id = _get_correlation_id(request)
+        errors = _format_errors(exc)
         
-        # Format validation errors
-        errors = []
-        for error in exc.errors():
-            error_detail = {
-                "loc": error.get("loc", []),
-                "msg": error.get("msg", ""),
-                "type": error.get("type", ""),
-            }
-            errors.append(error_detail)
-        
-        # Log the error
         logger.error(
-            f"Pydantic Validation Error: {errors} "
-            f"(correlation_id: {correlation_id})"
+            "%s: %s (correlation_id: %s)",
+            "Validation Error" if isinstance(exc, RequestValidationError) else "Pydantic Validation Error",
+            errors, correlation_id,
         )
         
         # Return JSON response
@@ -385,19 +347,14 @@ def setup_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(IntegrityError)
     async def integrity_error_handler(
         request: Request, exc: IntegrityError
-    ) -> JSONResponse:
+    ) -> AppORJSONResponse:
         """Handle database integrity errors."""
-        # Get correlation ID from request state if available
-        correlation_id = getattr(request.state, "correlation_id", None)
+        correlation_id = _get_correlation_id(request)
         
-        # Log the error
-        logger.error(
-            f"Database Integrity Error: {str(exc)} "
-            f"(correlation_id: {correlation_id})"
-        )
+        logger.error("Database Integrity Error: %s (correlation_id: %s)", exc, correlation_id)
         
         # Return JSON response
-        return JSONResponse(
+        return AppORJSONResponse(
             status_code=status.HTTP_409_CONFLICT,
             content={
                 "error": {
@@ -412,19 +369,14 @@ def setup_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(SQLAlchemyError)
     async def sqlalchemy_error_handler(
         request: Request, exc: SQLAlchemyError
-    ) -> JSONResponse:
+    ) -> AppORJSONResponse:
         """Handle SQLAlchemy errors."""
-        # Get correlation ID from request state if available
-        correlation_id = getattr(request.state, "correlation_id", None)
+        correlation_id = _get_correlation_id(request)
         
-        # Log the error
-        logger.error(
-            f"Database Error: {str(exc)} "
-            f"(correlation_id: {correlation_id})"
-        )
+        logger.error("Database Error: %s (correlation_id: %s)", exc, correlation_id)
         
         # Return JSON response
-        return JSONResponse(
+        return AppORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": {
@@ -438,19 +390,14 @@ def setup_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(Exception)
     async def general_exception_handler(
         request: Request, exc: Exception
-    ) -> JSONResponse:
+    ) -> AppORJSONResponse:
         """Handle all other exceptions."""
-        # Get correlation ID from request state if available
-        correlation_id = getattr(request.state, "correlation_id", None)
+        correlation_id = _get_correlation_id(request)
         
-        # Log the error
-        logger.exception(
-            f"Unhandled Exception: {str(exc)} "
-            f"(correlation_id: {correlation_id})"
-        )
+        logger.exception("Unhandled Exception: %s (correlation_id: %s)", exc, correlation_id)
         
         # Return JSON response
-        return JSONResponse(
+        return AppORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": {
@@ -5,29 +5,81 @@ This module sets up the FastAPI application with middleware,
 exception handlers, and API router registration.
 """
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+import queue
+from contextlib import asynccontextmanager, contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterator
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
 
 from app import __app_name__, __version__
 from app.config import settings
-from app.database import init_db
+from app.database import engine, init_db
 from app.api.v1.api import api_router
 from app.errors import OrderValidationError, ProductValidationError, setup_exception_handlers
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO if not settings.DEBUG else logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+from app.middleware import setup_middlewares
+from app.responses import AppORJSONResponse
+
+# Prefer uvloop's event loop when it is installed (uvicorn[standard]); it is
+# optional so the app still runs on platforms where it is unavailable.
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+logging.root.setLevel(logging.INFO if not settings.DEBUG else logging.DEBUG)
 logger = logging.getLogger(__app_name__)
 
 
+@contextmanager
+def queued_logging() -> Iterator[None]:
+    """
+    Route log records through a queue drained by a background thread.
+    
+    While active, log calls only enqueue their record, so they never block
+    the event loop on stream I/O. The queue handler is attached and the
+    listener started together, and both are removed again on exit, which
+    also flushes the records still queued.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    
+    listener.start()
+    logging.root.addHandler(queue_handler)
+    try:
+        yield
+    finally:
+        logging.root.removeHandler(queue_handler)
+        listener.stop()
+
+
+def check_unique_routes(app: FastAPI) -> None:
+    """
+    Ensure no route is registered more than once for the same method.
+    
+    Args:
+        app: The FastAPI application instance
+        
+    Raises:
+        RuntimeError: If the same path and method are registered twice
+    """
+    seen = set()
+    for route in app.router.routes:
+        key = (route.path, frozenset(getattr(route, "methods", None) or ()))
+        if key in seen:
+            raise RuntimeError(f"Duplicate route registered: {sorted(key[1])} {route.path}")
+        seen.add(key)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -35,15 +87,17 @@ async def lifespan(app: FastAPI):
     
     Handles startup and shutdown events.
     """
-    # Startup
-    logger.info("Starting up application...")
-    await init_db()
-    logger.info("Database initialized")
-    
-    yield
-    
-    # Shutdown
-    logger.info("Shutting down application...")
+    with queued_logging():
+        # Startup
+        logger.info("Starting up application...")
+        check_unique_routes(app)
+        await init_db()
+        logger.info("Database initialized")
+        
+        yield
+        
+        # Shutdown
+        logger.info("Shutting down application...")
 
 
 # Create FastAPI application
@@ -55,23 +109,27 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=AppORJSONResponse,
 )
 
 # Set up CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[str(origin) for origin in settings.BACKEND_CORS_ORIGINS],
+    allow_origins=settings.BACKEND_CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Request logging and correlation IDs (timing only in the testing environment)
+setup_middlewares(app)
+
 
 # Exception handlers
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors in requests."""
-    return JSONResponse(
+    return AppORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={"detail": exc.errors(), "body": exc.body},
     )
@@ -84,9 +142,8 @@ async def order_validation_error_handler(request: Request, exc: OrderValidationE
     
     # Log the error
     logger.error(
-        f"Order Validation Error: {exc.detail} "
-        f"(code: {exc.code}, error_type: {exc.error_type}, "
-        f"correlation_id: {correlation_id})"
+        "Order Validation Error: %s (code: %s, error_type: %s, correlation_id: %s)",
+        exc.detail, exc.code, exc.error_type, correlation_id,
     )
     
     # Create error response
@@ -100,9 +157,9 @@ async def order_validation_error_handler(request: Request, exc: OrderValidationE
     }
     
     # Return JSON response
-    return JSONResponse(
+    return AppORJSONResponse(
         status_code=exc.status_code,
-        content={"error": jsonable_encoder(error_response)},
+        content={"error": error_response},
         headers=exc.headers,
     )
 
@@ -114,9 +171,8 @@ async def product_validation_error_handler(request: Request, exc: ProductValidat
     
     # Log the error
     logger.error(
-        f"Product Validation Error: {exc.detail} "
-        f"(code: {exc.code}, error_type: {exc.error_type}, "
-        f"correlation_id: {correlation_id})"
+        "Product Validation Error: %s (code: %s, error_type: %s, correlation_id: %s)",
+        exc.detail, exc.code, exc.error_type, correlation_id,
     )
     
     # Create error response
@@ -130,9 +186,9 @@ async def product_validation_error_handler(request: Request, exc: ProductValidat
     }
     
     # Return JSON response
-    return JSONResponse(
+    return AppORJSONResponse(
         status_code=exc.status_code,
-        content={"error": jsonable_encoder(error_response)},
+        content={"error": error_response},
         headers=exc.headers,
     )
 
@@ -151,6 +207,8 @@ async def health_check():
         "version": __version__,
         "name": __app_name__,
         "environment": settings.ENV,
+        # Checked-in/checked-out connection counts, to spot pool exhaustion under load
+        "database_pool": engine.pool.status(),
     }
 
 
@@ -7,12 +7,12 @@ including logging, correlation IDs, and request timing.
 
 import logging
 import time
-import uuid
-from typing import Callable, Dict, Optional
+from os import urandom
+from typing import Optional
 
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.types import ASGIApp
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app import __app_name__
 from app.config import settings
@@ -21,95 +21,112 @@ from app.config import settings
 logger = logging.getLogger(__app_name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+def _get_header(scope: Scope, name: bytes) -> Optional[str]:
+    """Return the first value of a request header, given its lowercase name."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+class RequestLoggingMiddleware:
     """
     Middleware for logging request and response information.
     
     Logs details about incoming requests and outgoing responses,
     including method, path, status code, and processing time.
+    
+    Written as plain ASGI rather than on BaseHTTPMiddleware, which wraps
+    every request in an extra task group and a streamed response.
     """
     
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request and log information.
         
         Args:
-            request: The incoming request
-            call_next: The next middleware or endpoint handler
-            
-        Returns:
-            Response: The response from the next handler
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        start_time = time.time()
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.perf_counter()
+        method, path = scope["method"], scope["path"]
         
-        # Get or generate correlation ID
-        correlation_id = request.headers.get("X-Correlation-ID", str(uuid.uuid4()))
-        request.state.correlation_id = correlation_id
+        # Get or generate correlation ID; request.state reads it from scope["state"]
+        correlation_id = _get_header(scope, b"x-correlation-id") or urandom(16).hex()
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
         
         # Log request details
-        logger.info(
-            f"Request started: {request.method} {request.url.path} "
-            f"(correlation_id: {correlation_id})"
-        )
+        logger.info("Request started: %s %s (correlation_id: %s)", method, path, correlation_id)
+        
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate processing time
+                process_time = time.perf_counter() - start_time
+                
+                # Log response details
+                logger.info(
+                    "Request completed: %s %s - Status: %s - Time: %.3fs (correlation_id: %s)",
+                    method, path, message["status"], process_time, correlation_id,
+                )
+                
+                # Add correlation ID to response headers
+                headers = MutableHeaders(scope=message)
+                headers["X-Correlation-ID"] = correlation_id
+                headers["X-Process-Time"] = f"{process_time:.6f}"
+            await send(message)
         
         # Process the request
         try:
-            response = await call_next(request)
-            
-            # Calculate processing time
-            process_time = time.time() - start_time
-            
-            # Log response details
-            logger.info(
-                f"Request completed: {request.method} {request.url.path} "
-                f"- Status: {response.status_code} - Time: {process_time:.3f}s "
-                f"(correlation_id: {correlation_id})"
-            )
-            
-            # Add correlation ID to response headers
-            response.headers["X-Correlation-ID"] = correlation_id
-            response.headers["X-Process-Time"] = str(process_time)
-            
-            return response
-            
+            await self.app(scope, receive, send_with_headers)
         except Exception as e:
             # Log exception
             logger.exception(
-                f"Request failed: {request.method} {request.url.path} "
-                f"- Error: {str(e)} "
-                f"(correlation_id: {correlation_id})"
+                "Request failed: %s %s - Error: %s (correlation_id: %s)",
+                method, path, e, correlation_id,
             )
             raise
 
 
-class TimingMiddleware(BaseHTTPMiddleware):
+class TimingMiddleware:
     """
     Middleware for timing request processing.
     
     Measures and adds processing time information to response headers.
     """
     
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request and add timing information.
         
         Args:
-            request: The incoming request
-            call_next: The next middleware or endpoint handler
-            
-        Returns:
-            Response: The response from the next handler with timing headers
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = time.time() - start_time
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.perf_counter()
         
-        response.headers["X-Process-Time"] = f"{process_time:.6f}"
-        return response
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                process_time = time.perf_counter() - start_time
+                MutableHeaders(scope=message)["X-Process-Time"] = f"{process_time:.6f}"
+            await send(message)
+        
+        await self.app(scope, receive, send_with_timing)
 
 
 # PUBLIC_INTERFACE
@@ -117,6 +134,9 @@ def setup_middlewares(app: FastAPI) -> None:
     """
     Set up all middleware for the FastAPI application.
     
+    RequestLoggingMiddleware already sets X-Process-Time, so TimingMiddleware
+    is only added when request logging is off (in the testing environment).
+    
     Args:
         app: The FastAPI application instance
         
@@ -129,6 +149,5 @@ def setup_middlewares(app: FastAPI) -> None:
     # Add request logging middleware if not in testing mode
     if settings.ENV != "testing":
         app.add_middleware(RequestLoggingMiddleware)
-    
-    # Add timing middleware
-    app.add_middleware(TimingMiddleware)
\ No newline at end of file
+    else:
+        app.add_middleware(TimingMiddleware)
\ No newline at end of file
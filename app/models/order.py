@@ -51,7 +51,6 @@ class Order(BaseModel):
         SQLAEnum(OrderStatus),
         nullable=False,
         default=OrderStatus.PENDING,
-        index=True,
         comment="Current status of the order"
     )
     total_amount: Mapped[Decimal] = mapped_column(
@@ -68,7 +67,6 @@ class Order(BaseModel):
     customer_email: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
-        index=True,
         comment="Customer's email address"
     )
     
@@ -114,6 +112,11 @@ class Order(BaseModel):
     __table_args__ = (
         CheckConstraint("total_amount >= 0", name="check_total_amount_positive"),
         Index("ix_orders_customer_email_status", "customer_email", "status"),
+        # Keyset pagination of the status and customer listings (filter, then ORDER BY id).
+        # They also serve plain lookups by status or email, so those columns need no
+        # index of their own
+        Index("ix_orders_status_id", "status", "id"),
+        Index("ix_orders_customer_email_id", "customer_email", "id"),
     )
     
     def __repr__(self) -> str:
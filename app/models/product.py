@@ -7,7 +7,7 @@ This module provides the Product model for storing product information.
 from decimal import Decimal
 from typing import List, Optional
 
-from sqlalchemy import String, Numeric, Integer, Text, Index, CheckConstraint
+from sqlalchemy import DDL, String, Numeric, Integer, Text, Index, CheckConstraint, event, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -63,7 +63,6 @@ class Product(BaseModel):
     category: Mapped[Optional[str]] = mapped_column(
         String(100),
         nullable=True,
-        index=True,
         comment="Product category"
     )
     image_url: Mapped[Optional[str]] = mapped_column(
@@ -83,14 +82,13 @@ class Product(BaseModel):
     )
     is_active: Mapped[bool] = mapped_column(
         default=True,
-        index=True,
         comment="Whether the product is active and can be purchased"
     )
     
     # Relationships
+    # order_items.product_id is ON DELETE RESTRICT: products in orders are not deleted
     order_items: Mapped[List["OrderItem"]] = relationship(
-        back_populates="product",
-        cascade="all, delete-orphan"
+        back_populates="product"
     )
     
     # Constraints
@@ -98,7 +96,38 @@ class Product(BaseModel):
         CheckConstraint("price >= 0", name="check_price_positive"),
         CheckConstraint("inventory_count >= 0", name="check_inventory_non_negative"),
         Index("ix_products_name_category", "name", "category"),
+        # Keyset pagination of the category listing (filter, then ORDER BY id)
+        Index("ix_products_category_id", "category", "id"),
+        # Pages through active products only; inactive rows are left out of the
+        # index. SQLite only uses it when the query repeats the predicate verbatim.
+        Index(
+            "ix_products_active_id",
+            "id",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
     )
     
     def __repr__(self) -> str:
-        return f"<Product(id={self.id}, name='{self.name}', sku='{self.sku}')>"
\ No newline at end of file
+        return f"<Product(id={self.id}, name='{self.name}', sku='{self.sku}')>"
+
+
+# Trigram indexes serving the case-insensitive substring product search
+# on PostgreSQL; other backends keep scanning the table
+event.listen(
+    Product.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+Index(
+    "ix_products_name_trgm",
+    func.lower(Product.name).label("name_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"name_lower": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_products_description_trgm",
+    func.lower(Product.description).label("description_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"description_lower": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
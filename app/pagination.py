@@ -0,0 +1,175 @@
+"""
+Keyset pagination helpers.
+
+This module provides encoding and decoding of the opaque cursors used by
+list endpoints to page through results without OFFSET scans, and the
+building of page responses that carry them.
+"""
+
+import base64
+import binascii
+import hashlib
+from typing import Any, AsyncIterator, Dict, Optional, Sequence, Tuple, TypeVar
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from sqlalchemy import Row
+
+from app.errors import BadRequestError
+
+T = TypeVar("T")
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+# PUBLIC_INTERFACE
+def encode_cursor(last_id: int) -> str:
+    """
+    Encode the ID of the last row of a page into an opaque cursor.
+
+    Args:
+        last_id: ID of the last record returned in the current page
+
+    Returns:
+        str: URL-safe cursor pointing just after that record
+    """
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode().rstrip("=")
+
+
+# PUBLIC_INTERFACE
+def decode_cursor(cursor: str) -> int:
+    """
+    Decode an opaque cursor back into the ID it points after.
+
+    Args:
+        cursor: Cursor previously returned by encode_cursor
+
+    Returns:
+        int: ID of the last record of the previous page
+
+    Raises:
+        BadRequestError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        last_id = int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise BadRequestError(detail="Invalid pagination cursor", code="invalid_cursor")
+    if last_id < 0:
+        raise BadRequestError(detail="Invalid pagination cursor", code="invalid_cursor")
+    return last_id
+
+
+# PUBLIC_INTERFACE
+def split_page(rows: Sequence[T], limit: int) -> Tuple[Sequence[T], Dict[str, str]]:
+    """
+    Trim a page fetched with limit + 1 rows and build its response headers.
+
+    The extra row only tells whether another page follows, so the last page
+    gets no cursor and clients never request a trailing empty page.
+
+    Args:
+        rows: Records fetched with a limit of limit + 1, ordered by ID
+        limit: Page size requested by the client
+
+    Returns:
+        Tuple[Sequence[T], Dict[str, str]]: The page and its headers, carrying
+        the next cursor if more records follow
+    """
+    if len(rows) <= limit:
+        return rows, {}
+    page = rows[:limit]
+    return page, {NEXT_CURSOR_HEADER: encode_cursor(page[-1].id)}
+
+
+# PUBLIC_INTERFACE
+async def json_page_response(
+    item_adapter: TypeAdapter,
+    rows: AsyncIterator[Any],
+    limit: int,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Serialize a streamed page of rows into a JSON array, one row at a time.
+    
+    Only the encoded bytes are kept, so each ORM object can be released as soon
+    as it is serialized. The rows must be fetched with a limit of limit + 1; the
+    extra row is not serialized and only adds the next cursor header.
+    
+    The body is still buffered rather than sent as a StreamingResponse, because
+    the database session is closed before a streamed body would be consumed.
+    
+    Args:
+        item_adapter: Adapter for a single item of the response schema
+        rows: Records streamed from the database, ordered by ID
+        limit: Page size requested by the client
+        headers: Extra response headers
+        
+    Returns:
+        Response: JSON array response for the page
+    """
+    headers = dict(headers or {})
+    chunks = []
+    last_id = None
+    async for row in rows:
+        if len(chunks) == limit:
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(last_id)
+            break
+        item = item_adapter.validate_python(row, from_attributes=True)
+        chunks.append(item_adapter.dump_json(item))
+        last_id = row.id
+    return Response(
+        content=b"[" + b",".join(chunks) + b"]",
+        headers=headers,
+        media_type="application/json"
+    )
+
+
+# PUBLIC_INTERFACE
+def page_etag(rows: Sequence[Row], headers: Dict[str, str]) -> str:
+    """
+    Compute a strong ETag for a page of rows split by split_page.
+    
+    The tag covers every column of the returned rows and the next cursor, so
+    it changes exactly when the page a client would receive changes. It is
+    computed before the rows are serialized, which lets a matching
+    If-None-Match be answered without building the body.
+    
+    Args:
+        rows: Rows of the page, holding exactly the columns of the response schema
+        headers: Headers returned by split_page for the page
+        
+    Returns:
+        str: Quoted ETag value
+    """
+    digest = hashlib.sha1()
+    for row in rows:
+        digest.update(repr(tuple(row)).encode())
+    digest.update(headers.get(NEXT_CURSOR_HEADER, "").encode())
+    return f'"{digest.hexdigest()}"'
+
+
+# PUBLIC_INTERFACE
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Tell whether an If-None-Match header matches an ETag.
+    
+    The header is a comma-separated list of entity tags or "*". Tags are
+    compared weakly, as If-None-Match requires, so a W/ prefix is ignored.
+    
+    Args:
+        if_none_match: Value of the If-None-Match request header, if any
+        etag: Quoted ETag of the current representation
+        
+    Returns:
+        bool: True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag.removeprefix("W/")
+        for tag in if_none_match.split(",")
+    )
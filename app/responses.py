@@ -0,0 +1,64 @@
+"""
+JSON response helpers.
+
+This module provides serialization of endpoint results through precompiled
+Pydantic TypeAdapters into ready-made JSON responses.
+"""
+
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+import orjson
+from fastapi import Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+
+def _encode_decimal(value: Any) -> str:
+    """Encode Decimal values as strings; any other unsupported type is an error."""
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class AppORJSONResponse(ORJSONResponse):
+    """
+    Default JSON response of the application, rendered by orjson.
+    
+    Decimal values, which orjson has no native encoding for, are rendered as
+    strings, so handlers can pass plain dicts without running jsonable_encoder.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_encode_decimal, option=orjson.OPT_NON_STR_KEYS)
+
+
+# PUBLIC_INTERFACE
+def json_response(
+    adapter: TypeAdapter,
+    data: Any,
+    status_code: int = status.HTTP_200_OK,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Serialize ORM data through a precompiled TypeAdapter.
+    
+    Returning a ready-made Response makes FastAPI skip its own response-model
+    validation pass, so the data is validated and encoded exactly once.
+    
+    Args:
+        adapter: Adapter for the response schema
+        data: ORM object(s) or rows to serialize, with needed relationships loaded
+        status_code: HTTP status code of the response
+        headers: Extra response headers
+        
+    Returns:
+        Response: JSON response containing the serialized data
+    """
+    payload = adapter.validate_python(data, from_attributes=True)
+    return Response(
+        content=adapter.dump_json(payload),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json"
+    )
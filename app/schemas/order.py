@@ -9,7 +9,7 @@ from decimal import Decimal
 from enum import Enum
 from typing import Optional, List
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, field_validator
 
 from app.models.order import OrderStatus
 from app.schemas.product import ProductSummary
@@ -122,6 +122,16 @@ class OrderUpdate(BaseModel):
     notes: Optional[str] = Field(None, description="Additional notes for the order")
 
 
+# PUBLIC_INTERFACE
+class OrderStatusUpdate(BaseModel):
+    """
+    Schema for updating the status of an order.
+    
+    This schema is used for validating order status update requests.
+    """
+    status: OrderStatus = Field(..., description="New status of the order")
+
+
 # PUBLIC_INTERFACE
 class OrderInDB(OrderBase):
     """
@@ -148,6 +158,14 @@ class OrderResponse(OrderInDB):
     """
     items: List[OrderItemResponse] = Field(default_factory=list, description="List of order items")
 
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, frozen=True)
+
+
+# Compiled once at import time so endpoints can validate and serialize orders
+# without FastAPI rebuilding the response-model path on every request.
+order_response_adapter = TypeAdapter(OrderResponse)
+order_response_list_adapter = TypeAdapter(List[OrderResponse])
+
 
 # PUBLIC_INTERFACE
 class OrderSummary(BaseModel):
@@ -165,6 +183,10 @@ class OrderSummary(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+order_summary_adapter = TypeAdapter(OrderSummary)
+order_summary_list_adapter = TypeAdapter(List[OrderSummary])
+
+
 # PUBLIC_INTERFACE
 class OrderStatusResponse(OrderInDB):
     """
@@ -176,3 +198,6 @@ class OrderStatusResponse(OrderInDB):
     items: Optional[List[OrderItemResponse]] = None
     
     model_config = ConfigDict(from_attributes=True)
+
+
+order_status_response_adapter = TypeAdapter(OrderStatusResponse)
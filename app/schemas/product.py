@@ -8,7 +8,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional, List
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, field_validator
 
 
 # PUBLIC_INTERFACE
@@ -97,4 +97,11 @@ class ProductSummary(BaseModel):
     sku: str
     price: Decimal
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Compiled once at import time so endpoints can validate and serialize products
+# without FastAPI rebuilding the response-model path on every request.
+product_response_adapter = TypeAdapter(ProductResponse)
+product_summary_adapter = TypeAdapter(ProductSummary)
+product_summary_list_adapter = TypeAdapter(List[ProductSummary])
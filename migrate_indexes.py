@@ -0,0 +1,51 @@
+"""
+Bring the indexes of an existing database in line with the models.
+
+``create_tables.py`` relies on ``Base.metadata.create_all``, which skips tables
+that already exist, so databases created before the keyset pagination indexes
+keep the old single-column indexes and never get the new ones. This script
+drops the superseded indexes and creates the replacements; it is idempotent.
+"""
+import asyncio
+from sqlalchemy import text
+from app.database import Base, engine
+from app.models.product import Product
+from app.models.order import Order, OrderItem
+
+# Single-column indexes replaced by the composite/partial indexes below
+DROPPED_INDEXES = (
+    "ix_orders_status",
+    "ix_orders_customer_email",
+    "ix_products_category",
+    "ix_products_is_active",
+)
+
+ADDED_INDEXES = (
+    "ix_orders_status_id",
+    "ix_orders_customer_email_id",
+    "ix_products_category_id",
+    "ix_products_active_id",
+    # PostgreSQL only; skipped on other dialects
+    "ix_products_name_trgm",
+    "ix_products_description_trgm",
+)
+
+
+def _create_added_indexes(sync_conn):
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name in ADDED_INDEXES:
+                index.create(sync_conn, checkfirst=True)
+
+
+async def migrate_indexes():
+    async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for name in DROPPED_INDEXES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        await conn.run_sync(_create_added_indexes)
+    print('Indexes migrated successfully')
+
+if __name__ == "__main__":
+    asyncio.run(migrate_indexes())
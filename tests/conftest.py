@@ -8,7 +8,8 @@ The database initialization process:
 1. Create a file-based SQLite database for testing
 2. Import all models to ensure they're registered with SQLAlchemy
 3. Create all tables using Base.metadata.create_all
-4. Reset the database between tests to ensure a clean state
+4. Run each test inside a transaction that is rolled back afterwards, so
+   every test starts from the same empty schema without recreating it
 """
 
 import asyncio
@@ -21,19 +22,35 @@ import pytest
 import pytest_asyncio
 from fastapi import FastAPI
 from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 
 from app import __app_name__, __version__
 from app.api.v1.api import api_router
 from app.config import Settings, settings
-from app.database import Base, get_db, init_db
+from app.database import Base, enable_sqlite_foreign_keys, get_db, get_ro_db, init_db
 # Explicitly import all models to ensure they're registered with SQLAlchemy
 from app.models.order import Order, OrderItem, OrderStatus
 from app.models.product import Product
 
 
+# Run the suite on the same event loop implementation as production
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """
+    Provide uvloop's event loop policy when it is installed.
+    
+    Returns:
+        asyncio.AbstractEventLoopPolicy: uvloop policy, or the asyncio default
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
 # Test settings with file-based SQLite database for testing
 @pytest.fixture(scope="session")
 def test_settings() -> Settings:
@@ -51,6 +68,7 @@ def test_settings() -> Settings:
         DATABASE_URL="sqlite+aiosqlite:///./test.db",
         SECRET_KEY="test_secret_key",
         PAGINATION_PAGE_SIZE=10,
+        CACHE_TTL_SECONDS=0,
     )
 
 
@@ -89,6 +107,18 @@ async def engine():
         poolclass=NullPool,
     )
     
+    # pysqlite (and aiosqlite on top of it) manages transactions itself and
+    # breaks SAVEPOINT handling; let SQLAlchemy emit BEGIN instead
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
+    enable_sqlite_foreign_keys(engine)
+    
     # Import all models to ensure they're registered with SQLAlchemy
     from app.models.product import Product
     from app.models.order import Order, OrderItem
@@ -110,60 +140,51 @@ async def engine():
     await engine.dispose()
 
 
-# Reset database tables between tests
-@pytest_asyncio.fixture(scope="function")
-async def reset_db(engine):
+# Create the session factory once for the whole test session
+@pytest.fixture(scope="session")
+def session_factory(engine) -> async_sessionmaker[AsyncSession]:
     """
-    Reset database tables between tests.
+    Create the async session factory shared by all tests.
     
-    This fixture ensures that each test starts with a clean database.
+    Sessions join the per-test connection transaction through SAVEPOINTs,
+    so commits and rollbacks issued by the code under test stay inside it.
     
     Args:
         engine: SQLAlchemy async engine
+        
+    Returns:
+        async_sessionmaker: Session factory for the test database
     """
-    # Drop all tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    
-    # Import all models to ensure they're registered with SQLAlchemy
-    from app.models.product import Product
-    from app.models.order import Order, OrderItem
-    
-    # Create all tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    return async_sessionmaker(
+        expire_on_commit=False,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
 
 
 # Create async session for tests
 @pytest_asyncio.fixture(scope="function")
-async def db_session(engine, reset_db) -> AsyncGenerator[AsyncSession, None]:
+async def db_session(
+    engine, session_factory: async_sessionmaker[AsyncSession]
+) -> AsyncGenerator[AsyncSession, None]:
     """
     Create async session for tests.
     
+    The session is bound to a connection whose outer transaction is rolled
+    back when the test finishes, leaving the database empty for the next test.
+    
     Args:
         engine: SQLAlchemy async engine
-        reset_db: Reset database fixture
+        session_factory: Shared session factory
         
     Yields:
         AsyncSession: SQLAlchemy async session
     """
-    # Create session factory
-    async_session_factory = sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False,
-    )
-    
-    async with async_session_factory() as session:
-        try:
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        async with session_factory(bind=connection) as session:
             yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+        await transaction.rollback()
 
 
 # Override get_db dependency for tests
@@ -201,8 +222,9 @@ async def app(override_get_db) -> FastAPI:
     """
     from app.main import app as main_app
     
-    # Override get_db dependency
+    # Override both session dependencies with the test session
     main_app.dependency_overrides[get_db] = override_get_db
+    main_app.dependency_overrides[get_ro_db] = override_get_db
     
     return main_app
 
@@ -537,8 +559,8 @@ async def test_products(db_session: AsyncSession) -> List[Product]:
     Returns:
         List[Product]: List of test products
     """
-    products = [
-        Product(
+    product_rows = [
+        dict(
             name="Product 1",
             description="Description for Product 1",
             price=19.99,
@@ -550,7 +572,7 @@ async def test_products(db_session: AsyncSession) -> List[Product]:
             dimensions="10x20x30 cm",
             is_active=True,
         ),
-        Product(
+        dict(
             name="Product 2",
             description="Description for Product 2",
             price=29.99,
@@ -562,7 +584,7 @@ async def test_products(db_session: AsyncSession) -> List[Product]:
             dimensions="15x25x35 cm",
             is_active=True,
         ),
-        Product(
+        dict(
             name="Product 3",
             description="Description for Product 3",
             price=39.99,
@@ -576,15 +598,13 @@ async def test_products(db_session: AsyncSession) -> List[Product]:
         ),
     ]
     
-    for product in products:
-        db_session.add(product)
-    
+    # Insert all rows in one executemany; RETURNING hands back the ORM objects
+    products = list(await db_session.scalars(
+        insert(Product).returning(Product, sort_by_parameter_order=True),
+        product_rows,
+    ))
     await db_session.commit()
     
-    # Refresh products to get IDs
-    for product in products:
-        await db_session.refresh(product)
-    
     return products
 
 
@@ -605,9 +625,9 @@ async def test_products_inventory(db_session: AsyncSession) -> List[Product]:
     Returns:
         List[Product]: List of test products with varied inventory levels
     """
-    products = [
+    product_rows = [
         # High inventory product
-        Product(
+        dict(
             name="High Inventory Product",
             description="This product has high inventory",
             price=19.99,
@@ -617,7 +637,7 @@ async def test_products_inventory(db_session: AsyncSession) -> List[Product]:
             is_active=True,
         ),
         # Low inventory product
-        Product(
+        dict(
             name="Low Inventory Product",
             description="This product has low inventory",
             price=29.99,
@@ -627,7 +647,7 @@ async def test_products_inventory(db_session: AsyncSession) -> List[Product]:
             is_active=True,
         ),
         # Out of stock product
-        Product(
+        dict(
             name="Out of Stock Product",
             description="This product is out of stock",
             price=39.99,
@@ -638,15 +658,13 @@ async def test_products_inventory(db_session: AsyncSession) -> List[Product]:
         ),
     ]
     
-    for product in products:
-        db_session.add(product)
-    
+    # Insert all rows in one executemany; RETURNING hands back the ORM objects
+    products = list(await db_session.scalars(
+        insert(Product).returning(Product, sort_by_parameter_order=True),
+        product_rows,
+    ))
     await db_session.commit()
     
-    # Refresh products to get IDs
-    for product in products:
-        await db_session.refresh(product)
-    
     return products
 
 
@@ -668,9 +686,9 @@ async def test_products_price_points(db_session: AsyncSession) -> List[Product]:
     Returns:
         List[Product]: List of test products with varied price points
     """
-    products = [
+    product_rows = [
         # Low price product
-        Product(
+        dict(
             name="Budget Product",
             description="This is a budget-friendly product",
             price=9.99,
@@ -680,7 +698,7 @@ async def test_products_price_points(db_session: AsyncSession) -> List[Product]:
             is_active=True,
         ),
         # Medium price product
-        Product(
+        dict(
             name="Standard Product",
             description="This is a standard-priced product",
             price=49.99,
@@ -690,7 +708,7 @@ async def test_products_price_points(db_session: AsyncSession) -> List[Product]:
             is_active=True,
         ),
         # High price product
-        Product(
+        dict(
             name="Premium Product",
             description="This is a premium-priced product",
             price=199.99,
@@ -700,7 +718,7 @@ async def test_products_price_points(db_session: AsyncSession) -> List[Product]:
             is_active=True,
         ),
         # Very high price product
-        Product(
+        dict(
             name="Luxury Product",
             description="This is a luxury-priced product",
             price=999.99,
@@ -711,15 +729,13 @@ async def test_products_price_points(db_session: AsyncSession) -> List[Product]:
         ),
     ]
     
-    for product in products:
-        db_session.add(product)
-    
+    # Insert all rows in one executemany; RETURNING hands back the ORM objects
+    products = list(await db_session.scalars(
+        insert(Product).returning(Product, sort_by_parameter_order=True),
+        product_rows,
+    ))
     await db_session.commit()
     
-    # Refresh products to get IDs
-    for product in products:
-        await db_session.refresh(product)
-    
     return products
 
 
@@ -736,8 +752,8 @@ async def test_orders(db_session: AsyncSession, test_products: List[Product]) ->
     Returns:
         List[Order]: List of test orders
     """
-    orders = [
-        Order(
+    order_rows = [
+        dict(
             status=OrderStatus.PENDING,
             total_amount=39.98,  # 2 * 19.99
             customer_name="Customer 1",
@@ -749,7 +765,7 @@ async def test_orders(db_session: AsyncSession, test_products: List[Product]) ->
             payment_id="PAYMENT-001",
             notes="Order 1 notes",
         ),
-        Order(
+        dict(
             status=OrderStatus.PROCESSING,
             total_amount=59.98,  # 2 * 29.99
             customer_name="Customer 2",
@@ -763,25 +779,21 @@ async def test_orders(db_session: AsyncSession, test_products: List[Product]) ->
         ),
     ]
     
-    for order in orders:
-        db_session.add(order)
-    
-    await db_session.commit()
-    
-    # Refresh orders to get IDs
-    for order in orders:
-        await db_session.refresh(order)
+    orders = list(await db_session.scalars(
+        insert(Order).returning(Order, sort_by_parameter_order=True),
+        order_rows,
+    ))
     
     # Add order items
-    order_items = [
-        OrderItem(
+    order_item_rows = [
+        dict(
             order_id=orders[0].id,
             product_id=test_products[0].id,
             quantity=2,
             unit_price=test_products[0].price,
             subtotal=2 * test_products[0].price,
         ),
-        OrderItem(
+        dict(
             order_id=orders[1].id,
             product_id=test_products[1].id,
             quantity=2,
@@ -790,9 +802,7 @@ async def test_orders(db_session: AsyncSession, test_products: List[Product]) ->
         ),
     ]
     
-    for order_item in order_items:
-        db_session.add(order_item)
-    
+    await db_session.execute(insert(OrderItem), order_item_rows)
     await db_session.commit()
     
     return orders
@@ -814,10 +824,10 @@ async def test_orders_all_statuses(db_session: AsyncSession, test_products: List
         List[Order]: List of test orders with different statuses
     """
     # Create one order for each status
-    orders = []
+    order_rows = []
     
     for i, status in enumerate(OrderStatus):
-        order = Order(
+        order_rows.append(dict(
             status=status,
             total_amount=19.99 * (i + 1),
             customer_name=f"Status Customer {i + 1}",
@@ -828,37 +838,29 @@ async def test_orders_all_statuses(db_session: AsyncSession, test_products: List
             payment_method="Credit Card" if i % 2 == 0 else "PayPal",
             payment_id=f"STATUS-PAYMENT-{i + 1:03d}",
             notes=f"Order with status {status.value}",
-        )
-        orders.append(order)
+        ))
     
-    for order in orders:
-        db_session.add(order)
-    
-    await db_session.commit()
-    
-    # Refresh orders to get IDs
-    for order in orders:
-        await db_session.refresh(order)
+    orders = list(await db_session.scalars(
+        insert(Order).returning(Order, sort_by_parameter_order=True),
+        order_rows,
+    ))
     
     # Add order items (one item per order)
-    order_items = []
+    order_item_rows = []
     
     for i, order in enumerate(orders):
         # Use modulo to cycle through available products
         product_index = i % len(test_products)
         
-        order_item = OrderItem(
+        order_item_rows.append(dict(
             order_id=order.id,
             product_id=test_products[product_index].id,
             quantity=i + 1,
             unit_price=test_products[product_index].price,
             subtotal=(i + 1) * test_products[product_index].price,
-        )
-        order_items.append(order_item)
-    
-    for order_item in order_items:
-        db_session.add(order_item)
+        ))
     
+    await db_session.execute(insert(OrderItem), order_item_rows)
     await db_session.commit()
     
     return orders
@@ -906,24 +908,21 @@ async def test_order_multiple_items(db_session: AsyncSession, test_products: Lis
     
     # Add order items (multiple items)
     quantities = [2, 1, 3]
-    order_items = []
+    order_item_rows = []
     
     for i, product in enumerate(test_products):
         if i >= len(quantities):
             break
             
-        order_item = OrderItem(
+        order_item_rows.append(dict(
             order_id=order.id,
             product_id=product.id,
             quantity=quantities[i],
             unit_price=product.price,
             subtotal=quantities[i] * product.price,
-        )
-        order_items.append(order_item)
-    
-    for order_item in order_items:
-        db_session.add(order_item)
+        ))
     
+    await db_session.execute(insert(OrderItem), order_item_rows)
     await db_session.commit()
     
     return order
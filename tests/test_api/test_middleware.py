@@ -0,0 +1,57 @@
+"""
+Tests for the request middleware.
+
+This module contains tests for the timing and request logging middleware,
+including the correlation ID passed on to request handlers.
+"""
+
+import pytest
+from fastapi import FastAPI, Request, status
+from httpx import ASGITransport, AsyncClient
+
+from app.config import settings
+from app.middleware import setup_middlewares
+
+
+@pytest.mark.asyncio
+async def test_process_time_header(client: AsyncClient):
+    """
+    Test that API responses report their processing time.
+    
+    Args:
+        client: Test client
+    """
+    response = await client.get("/health")
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert float(response.headers["X-Process-Time"]) >= 0
+
+
+@pytest.mark.asyncio
+async def test_correlation_id_header(monkeypatch):
+    """
+    Test that the request logging middleware propagates correlation IDs.
+    
+    Args:
+        monkeypatch: Pytest monkeypatch fixture
+    """
+    monkeypatch.setattr(settings, "ENV", "development")
+    app = FastAPI()
+    setup_middlewares(app)
+    
+    @app.get("/correlation-id")
+    async def correlation_id(request: Request):
+        return {"correlation_id": request.state.correlation_id}
+    
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        # A correlation ID sent by the client is kept
+        response = await client.get("/correlation-id", headers={"X-Correlation-ID": "abc123"})
+        assert response.headers["X-Correlation-ID"] == "abc123"
+        assert response.json() == {"correlation_id": "abc123"}
+        assert float(response.headers["X-Process-Time"]) >= 0
+        
+        # Otherwise one is generated
+        response = await client.get("/correlation-id")
+        generated = response.headers["X-Correlation-ID"]
+        assert len(generated) == 32
+        assert response.json() == {"correlation_id": generated}
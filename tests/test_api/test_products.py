@@ -13,6 +13,7 @@ from fastapi import status
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.order import Order
 from app.models.product import Product
 
 
@@ -67,6 +68,52 @@ async def test_list_products_pagination(client: AsyncClient, test_products: List
     assert len(data) == 2
 
 
+@pytest.mark.asyncio
+async def test_list_products_cursor_pagination(client: AsyncClient, test_products: List[Product]):
+    """
+    Test walking through all products with keyset cursors.
+
+    Args:
+        client: Test client
+        test_products: List of test products
+    """
+    seen_ids = []
+    cursor = None
+
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/v1/products/", params=params)
+
+        assert response.status_code == status.HTTP_200_OK
+        seen_ids.extend(product["id"] for product in response.json())
+
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert seen_ids == sorted(product.id for product in test_products)
+
+
+@pytest.mark.asyncio
+async def test_list_products_is_active_filter(client: AsyncClient, test_products: List[Product]):
+    """
+    Test listing products filtered by active status.
+    
+    Args:
+        client: Test client
+        test_products: List of test products
+    """
+    for is_active in (True, False):
+        response = await client.get(f"/api/v1/products/?is_active={str(is_active).lower()}")
+        
+        assert response.status_code == status.HTTP_200_OK
+        
+        expected_ids = [product.id for product in test_products if product.is_active == is_active]
+        assert [product["id"] for product in response.json()] == expected_ids
+
+
 @pytest.mark.asyncio
 async def test_get_product(client: AsyncClient, test_products: List[Product]):
     """
@@ -262,6 +309,34 @@ async def test_delete_product(client: AsyncClient, test_products: List[Product])
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+@pytest.mark.asyncio
+async def test_delete_product_in_order(
+    client: AsyncClient, test_products: List[Product], test_orders: List[Order]
+):
+    """
+    Test that a product referenced by an order cannot be deleted.
+    
+    Args:
+        client: Test client
+        test_products: List of test products
+        test_orders: List of test orders, whose items reference the first products
+    """
+    product_id = test_products[0].id
+    
+    response = await client.delete(f"/api/v1/products/{product_id}")
+    
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert response.json()["error"]["code"] == "product_in_use"
+    
+    # Verify product and the order's items are kept
+    response = await client.get(f"/api/v1/products/{product_id}")
+    assert response.status_code == status.HTTP_200_OK
+    
+    response = await client.get(f"/api/v1/orders/{test_orders[0].id}")
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["product_id"] for item in response.json()["items"]] == [product_id]
+
+
 @pytest.mark.asyncio
 async def test_delete_product_not_found(client: AsyncClient):
     """
@@ -309,6 +384,65 @@ async def test_search_products(client: AsyncClient, test_products: List[Product]
     assert any(product["name"] == "Product 2" for product in data)
 
 
+@pytest.mark.asyncio
+async def test_search_products_short_query_matches_substring(client: AsyncClient, test_products: List[Product]):
+    """
+    Test that queries shorter than a trigram still match anywhere in the name.
+
+    Args:
+        client: Test client
+        test_products: List of test products
+    """
+    response = await client.get("/api/v1/products/search/?query=1")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert any(product["name"] == "Product 1" for product in response.json())
+
+
+@pytest.mark.asyncio
+async def test_search_products_wildcards_match_literally(client: AsyncClient, test_products: List[Product]):
+    """
+    Test that LIKE wildcards in a search query are not treated as patterns.
+
+    Args:
+        client: Test client
+        test_products: List of test products
+    """
+    for query in ("%%%", "Product_1"):
+        response = await client.get("/api/v1/products/search/", params={"query": query})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_search_products_cursor_pagination(client: AsyncClient, test_products: List[Product]):
+    """
+    Test walking through search results with keyset cursors.
+
+    Args:
+        client: Test client
+        test_products: List of test products
+    """
+    seen_ids = []
+    params = {"query": "Product", "limit": 2}
+
+    while True:
+        response = await client.get("/api/v1/products/search/", params=params)
+
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        assert len(page) <= 2
+        seen_ids.extend(product["id"] for product in page)
+
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        params["cursor"] = cursor
+
+    assert seen_ids == sorted(product.id for product in test_products)
+
+
 @pytest.mark.asyncio
 async def test_get_products_by_category(client: AsyncClient, test_products: List[Product]):
     """
@@ -325,4 +459,54 @@ async def test_get_products_by_category(client: AsyncClient, test_products: List
     data = response.json()
     assert isinstance(data, list)
     assert len(data) > 0
-    assert all(product["id"] in [p.id for p in test_products if p.category == "Category 1"] for product in data)
\ No newline at end of file
+    assert all(product["id"] in [p.id for p in test_products if p.category == "Category 1"] for product in data)
+
+@pytest.mark.asyncio
+async def test_get_products_by_category_etag(client: AsyncClient, test_products: List[Product]):
+    """
+    Test that category listings are revalidated with their ETag.
+    
+    Args:
+        client: Test client
+        test_products: List of test products
+    """
+    response = await client.get("/api/v1/products/category/Category 1")
+    
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "public, max-age=30"
+    
+    # Unchanged category
+    response = await client.get("/api/v1/products/category/Category 1", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    
+    # If-None-Match lists, weak tags and "*" are honoured
+    for if_none_match in (f'"other", W/{etag}', "*"):
+        response = await client.get(
+            "/api/v1/products/category/Category 1", headers={"If-None-Match": if_none_match}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    
+    # Only whole tags match
+    response = await client.get(
+        "/api/v1/products/category/Category 1", headers={"If-None-Match": f'"x{etag[1:-1]}x"'}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    
+    # A listed product is renamed without leaving the category
+    product_ids = [p.id for p in test_products if p.category == "Category 1"]
+    await client.put(f"/api/v1/products/{product_ids[0]}", json={"name": "Renamed Product"})
+    
+    response = await client.get("/api/v1/products/category/Category 1", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+    etag = response.headers["etag"]
+    
+    # A product leaves the category
+    await client.put(f"/api/v1/products/{product_ids[-1]}", json={"category": "Category 2"})
+    
+    response = await client.get("/api/v1/products/category/Category 1", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag